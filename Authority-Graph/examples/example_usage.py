@@ -6,7 +6,22 @@ Demonstrates real-world usage patterns for the PointZero Member C component
 
 import sys
 import os
-import json
+
+# Pretty-print only for a terminal; piped output stays compact
+_PRETTY = sys.stdout.isatty()
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _PRETTY else 0)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2 if _PRETTY else None)
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
@@ -55,7 +70,7 @@ example1 = [
 ]
 
 graph1 = build_single_wallet_graph(example1)
-print(json.dumps(graph1, indent=2))
+print(_dumps(graph1))
 
 print("\n" + "=" * 60)
 print("EXAMPLE 2: Multiple Wallets with Mixed Authority Types")
@@ -92,7 +107,7 @@ example2 = [
 ]
 
 graphs2 = build_authority_graph(example2)
-print(json.dumps(graphs2, indent=2))
+print(_dumps(graphs2))
 
 print("\n" + "=" * 60)
 print("All examples demonstrate:")
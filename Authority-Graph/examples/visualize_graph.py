@@ -6,7 +6,23 @@ Generates a visual representation of authority relationships
 
 import sys
 import os
-import json
+from operator import itemgetter
+
+# Pretty-print only for a terminal; piped output stays compact
+_PRETTY = sys.stdout.isatty()
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _PRETTY else 0)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2 if _PRETTY else None)
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
@@ -15,6 +31,7 @@ from authority_graph_builder import build_authority_graph
 
 try:
     import networkx as nx
+    import numpy as np
     import matplotlib.pyplot as plt
     from matplotlib.patches import FancyBboxPatch
 except ImportError:
@@ -22,6 +39,343 @@ except ImportError:
     print("Install with: pip install networkx matplotlib")
     sys.exit(1)
 
+try:
+    from scipy.optimize import minimize
+except ImportError:
+    minimize = None
+
+
+# Graphs with more nodes than this use the L-BFGS layout (requires scipy)
+LBFGS_LAYOUT_THRESHOLD = 200
+
+# Multilevel levels with more nodes than this are refined with Barnes-Hut
+# (the L-BFGS energy holds O(n^2) pairwise distances)
+BARNES_HUT_LAYOUT_THRESHOLD = 2000
+
+# Multilevel layout stops coarsening at this many nodes
+MULTILEVEL_COARSEST_SIZE = 50
+
+# Graphs with more edges than this are not rendered at all
+RENDER_MAX_EDGES = 20000
+
+# Graphs with at least this many edges are saved at a lower dpi, with the
+# edges drawn without arrowheads as rasterized line collections
+RASTERIZE_EDGES_THRESHOLD = 5000
+
+# Working precision of the layout loops; a figure needs ~3 digits, and the
+# pairwise buffers are memory-bound, so float32 halves their traffic
+LAYOUT_DTYPE = np.float32
+
+
+def _fr_lbfgs_layout(G, dim=2, seed=42, edge_length=1.0, repulsion=1.0, gravity=0.01,
+                     pos=None, maxiter=200):
+    """
+    Fruchterman-Reingold style layout by direct energy minimization
+    
+    Minimizes sum over edges of (|xi - xj| - L)^2 plus C / |xi - xj| over
+    all node pairs with SciPy's L-BFGS-B, using the analytic gradient. A
+    weak gravity term keeps disconnected components from drifting apart.
+    Positions and the pairwise buffers are LAYOUT_DTYPE; energy sums are
+    accumulated in float64 so the line search stays stable.
+    
+    Args:
+        G: NetworkX graph
+        dim: Layout dimension
+        seed: Seed for the random initial positions
+        edge_length: Natural edge length L
+        repulsion: Repulsion strength C
+        gravity: Strength of the pull towards the origin
+        pos: Optional initial positions in [-1, 1] (random if omitted)
+        maxiter: Maximum number of L-BFGS iterations
+        
+    Returns:
+        Dict mapping nodes to positions, rescaled to [-1, 1]
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, format='coo')
+    src, dst = A.row, A.col
+    
+    if pos is None:
+        x0 = np.random.default_rng(seed).standard_normal((n, dim), dtype=LAYOUT_DTYPE)
+    else:
+        x0 = np.array([pos[node] for node in nodes], dtype=LAYOUT_DTYPE)
+    x0 *= LAYOUT_DTYPE(np.sqrt(n))
+    
+    def energy_and_grad(flat):
+        x = flat.astype(LAYOUT_DTYPE).reshape(n, dim)
+        
+        # Attraction along edges
+        d = x[src] - x[dst]
+        r = np.sqrt((d * d).sum(axis=1)) + LAYOUT_DTYPE(1e-9)
+        stretch = r - LAYOUT_DTYPE(edge_length)
+        energy = float((stretch * stretch).sum(dtype=np.float64))
+        pull = (2 * stretch / r)[:, None] * d
+        grad = np.zeros_like(x)
+        np.add.at(grad, src, pull)
+        np.subtract.at(grad, dst, pull)
+        
+        # Repulsion between all pairs, via the Gram matrix to avoid an
+        # (n, n, dim) difference tensor
+        sq = (x * x).sum(axis=1)
+        dist2 = np.maximum(sq[:, None] + sq[None, :] - 2 * (x @ x.T), 1e-12)
+        np.fill_diagonal(dist2, np.inf)
+        inv = 1 / np.sqrt(dist2)
+        energy += repulsion * float(inv.sum(dtype=np.float64)) / 2
+        w = inv ** 3
+        grad -= LAYOUT_DTYPE(repulsion) * (x * w.sum(axis=1)[:, None] - w @ x)
+        
+        # Gravity
+        energy += gravity * float(sq.sum(dtype=np.float64))
+        grad += LAYOUT_DTYPE(2 * gravity) * x
+        
+        # SciPy's L-BFGS-B works in float64
+        return energy, grad.ravel().astype(np.float64)
+    
+    result = minimize(energy_and_grad, x0.ravel().astype(np.float64), jac=True,
+                      method='L-BFGS-B', options={'maxiter': maxiter})
+    coords = nx.rescale_layout(result.x.reshape(n, dim))
+    return dict(zip(nodes, coords))
+
+
+def _bh_repulsion(x, k, theta):
+    """
+    Approximate Fruchterman-Reingold repulsion with a Barnes-Hut quadtree
+    
+    The quadtree is stored level by level as flat cell arrays (mass and
+    centroid per cell). All (node, cell) pairs still open at a level are
+    processed together: a cell that looks small from the node (size /
+    distance < theta) contributes through its centroid, the rest are
+    split into their children. At the deepest level the node interacts
+    with the centroid of the other members of its own cell.
+    
+    Args:
+        x: Node positions, shape (n, 2), LAYOUT_DTYPE
+        k: Optimal distance between nodes
+        theta: Opening criterion
+        
+    Returns:
+        Repulsive displacement per node, shape (n, 2)
+    """
+    n = len(x)
+    depth = min(10, max(1, int(np.ceil(np.log(n) / np.log(4))) + 1))
+    
+    lo = x.min(axis=0)
+    extent = max(float((x.max(axis=0) - lo).max()), 1e-9) * (1 + 1e-9)
+    
+    # Per-level cell index, mass and centroid
+    cell_xy = np.floor((x - lo) / extent * (1 << depth)).astype(np.int64)
+    masses, centroids, node_cells = [], [], []
+    for level in range(depth + 1):
+        side = 1 << level
+        cxy = cell_xy >> (depth - level)
+        cell = cxy[:, 1] * side + cxy[:, 0]
+        mass = np.bincount(cell, minlength=side * side)
+        csum = np.stack([np.bincount(cell, weights=x[:, d], minlength=side * side)
+                         for d in range(2)], axis=1)
+        masses.append(mass.astype(x.dtype))
+        centroids.append((csum / np.maximum(mass, 1)[:, None]).astype(x.dtype))
+        node_cells.append(cell)
+    
+    disp = np.zeros_like(x)
+    
+    def push(nodes, mass, centroid):
+        delta = x[nodes] - centroid
+        dist2 = np.maximum((delta * delta).sum(axis=1), 1e-12)
+        np.add.at(disp, nodes, delta * (mass * k * k / dist2)[:, None])
+    
+    # Open (node, cell) pairs, starting from the root cell
+    nodes = np.arange(n)
+    cells = np.zeros(n, dtype=np.int64)
+    for level in range(depth + 1):
+        side = 1 << level
+        own = cells == node_cells[level][nodes]
+        delta = x[nodes] - centroids[level][cells]
+        dist = np.sqrt((delta * delta).sum(axis=1))
+        far = ~own & (extent / side < theta * dist)
+        push(nodes[far], masses[level][cells[far]], centroids[level][cells[far]])
+        
+        if level == depth:
+            # Leaf cells: remaining neighbours act through their centroid,
+            # and co-members through the centroid of the others
+            rest = ~far & ~own
+            push(nodes[rest], masses[level][cells[rest]], centroids[level][cells[rest]])
+            self_nodes, self_cells = nodes[own], cells[own]
+            others = masses[level][self_cells] - 1
+            shared = others > 0
+            self_nodes, self_cells, others = self_nodes[shared], self_cells[shared], others[shared]
+            centroid = (centroids[level][self_cells] * (others + 1)[:, None]
+                        - x[self_nodes]) / others[:, None]
+            push(self_nodes, others, centroid)
+            break
+        
+        # Split the remaining cells into their non-empty children
+        nodes, cells = nodes[~far], cells[~far]
+        cx, cy = cells % side, cells // side
+        child_nodes, child_cells = [], []
+        for dx in (0, 1):
+            for dy in (0, 1):
+                child = (2 * cy + dy) * (2 * side) + (2 * cx + dx)
+                keep = masses[level + 1][child] > 0
+                child_nodes.append(nodes[keep])
+                child_cells.append(child[keep])
+        nodes = np.concatenate(child_nodes)
+        cells = np.concatenate(child_cells)
+    
+    return disp
+
+
+def _bh_spring_layout(G, iterations=50, theta=0.9, seed=42, pos=None, temperature=0.1):
+    """
+    Fruchterman-Reingold layout with Barnes-Hut approximated repulsion
+    
+    Follows the cooling schedule of nx.spring_layout, but repulsion costs
+    O(n log n) per iteration instead of O(n^2). Attraction is exact.
+    
+    Args:
+        G: NetworkX graph
+        iterations: Number of iterations
+        theta: Barnes-Hut opening criterion (smaller is more exact)
+        seed: Seed for the random initial positions
+        pos: Optional initial positions in [-1, 1] (random if omitted)
+        temperature: Initial step size as a fraction of the layout extent
+        
+    Returns:
+        Dict mapping nodes to positions, rescaled to [-1, 1]
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64).reshape(-1, 2)
+    
+    if pos is None:
+        x = np.random.default_rng(seed).random((n, 2), dtype=LAYOUT_DTYPE)
+    else:
+        x = (np.array([pos[node] for node in nodes], dtype=LAYOUT_DTYPE) + 1) / 2
+    k = LAYOUT_DTYPE(np.sqrt(1.0 / n))
+    t = max(float((x.max(axis=0) - x.min(axis=0)).max()), 1e-9) * temperature
+    dt = t / (iterations + 1)
+    
+    for _ in range(iterations):
+        disp = _bh_repulsion(x, k, theta)
+        
+        # Attraction along edges
+        delta = x[edges[:, 0]] - x[edges[:, 1]]
+        dist = np.sqrt((delta * delta).sum(axis=1))
+        pull = delta * (dist / k)[:, None]
+        np.subtract.at(disp, edges[:, 0], pull)
+        np.add.at(disp, edges[:, 1], pull)
+        
+        # Move each node at most t
+        length = np.maximum(np.sqrt((disp * disp).sum(axis=1)), 0.01)
+        x += disp * (t / length)[:, None]
+        t -= dt
+    
+    return dict(zip(nodes, nx.rescale_layout(x)))
+
+
+def _coarsen(H):
+    """
+    Contract a greedy heavy-edge matching of a weighted graph
+    
+    Edges are visited heaviest first and both endpoints are matched when
+    neither is matched yet. Each matched pair becomes one coarse node;
+    edge weights add up when edges collapse onto the same coarse edge.
+    
+    Args:
+        H: Undirected graph with integer nodes and a 'weight' edge attribute
+        
+    Returns:
+        Tuple of (coarse graph with nodes 0..m-1, dict mapping fine node to coarse node)
+    """
+    partner = {}
+    for u, v, _ in sorted(H.edges(data='weight'), key=itemgetter(2), reverse=True):
+        if u != v and u not in partner and v not in partner:
+            partner[u] = v
+            partner[v] = u
+    
+    parent = {}
+    coarse = 0
+    for node in H:
+        if node in parent:
+            continue
+        parent[node] = coarse
+        if node in partner:
+            parent[partner[node]] = coarse
+        coarse += 1
+    
+    C = nx.Graph()
+    C.add_nodes_from(range(coarse))
+    for u, v, w in H.edges(data='weight'):
+        cu, cv = parent[u], parent[v]
+        if cu == cv:
+            continue
+        if C.has_edge(cu, cv):
+            C[cu][cv]['weight'] += w
+        else:
+            C.add_edge(cu, cv, weight=w)
+    
+    return C, parent
+
+
+def _multilevel_layout(G, seed=42):
+    """
+    Multilevel force-directed layout (Hu 2005)
+    
+    Coarsens the graph by heavy-edge matching until it has at most
+    MULTILEVEL_COARSEST_SIZE nodes (or stops shrinking), lays out the
+    coarsest graph, then walks back up: each fine node starts at its
+    coarse node's position plus a small jitter and the level is refined
+    with a short L-BFGS run (Barnes-Hut on levels too large for it).
+    
+    Args:
+        G: NetworkX graph
+        seed: Seed for layouts and jitter
+        
+    Returns:
+        Dict mapping nodes to positions, rescaled to [-1, 1]
+    """
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    
+    # Finest level: undirected, integer-labelled, edge multiplicity as weight
+    H = nx.Graph()
+    H.add_nodes_from(range(len(nodes)))
+    for u, v in G.edges():
+        iu, iv = index[u], index[v]
+        if iu == iv:
+            continue
+        if H.has_edge(iu, iv):
+            H[iu][iv]['weight'] += 1
+        else:
+            H.add_edge(iu, iv, weight=1)
+    
+    levels, parents = [H], []
+    while levels[-1].number_of_nodes() > MULTILEVEL_COARSEST_SIZE:
+        C, parent = _coarsen(levels[-1])
+        if C.number_of_nodes() > 0.9 * levels[-1].number_of_nodes():
+            break
+        levels.append(C)
+        parents.append(parent)
+    
+    if minimize is not None:
+        pos = _fr_lbfgs_layout(levels[-1], seed=seed)
+    else:
+        pos = _bh_spring_layout(levels[-1], seed=seed)
+    
+    rng = np.random.default_rng(seed)
+    for H, parent in zip(reversed(levels[:-1]), reversed(parents)):
+        n = H.number_of_nodes()
+        jitter = rng.normal(scale=0.5 / np.sqrt(n), size=(n, 2))
+        init = {node: pos[parent[node]] + jitter[node] for node in H}
+        if minimize is not None and n <= BARNES_HUT_LAYOUT_THRESHOLD:
+            pos = _fr_lbfgs_layout(H, pos=init, maxiter=30)
+        else:
+            pos = _bh_spring_layout(H, pos=init, iterations=10, temperature=0.02)
+    
+    return {node: pos[index[node]] for node in nodes}
+
 
 def visualize_authority_graph(authority_data, output_file='authority_graph.png'):
     """
@@ -47,6 +401,11 @@ def visualize_authority_graph(authority_data, output_file='authority_graph.png')
     node_types = {}
     edge_labels = {}
     
+    # Edges by relationship, collected while walking the data so the graph
+    # never has to be rescanned (dicts keep insertion order and dedupe)
+    ownership_edges = {}
+    approval_edges = {}
+    
     # Process each wallet
     for wallet_addr, wallet_data in authority_data.items():
         # Add wallet node
@@ -71,62 +430,78 @@ def visualize_authority_graph(authority_data, output_file='authority_graph.png')
                 G.add_node(target, node_type='target')
                 node_types[target] = 'target'
             
-            # Add edges
-            G.add_edge(wallet_addr, contract, relationship='owns')
-            G.add_edge(contract, target, relationship='approval')
+            # Record edges
+            ownership_edges[(wallet_addr, contract)] = None
+            approval_edges[(contract, target)] = None
             
             # Store edge label
             edge_labels[(contract, target)] = f"{edge['type']}\n{edge['amount']}"
     
+    ownership_edges = list(ownership_edges)
+    approval_edges = list(approval_edges)
+    G.add_edges_from(ownership_edges, relationship='owns')
+    G.add_edges_from(approval_edges, relationship='approval')
+    
+    n_edges = G.number_of_edges()
+    if n_edges > RENDER_MAX_EDGES:
+        print(f"⚠️  Graph too large to render ({n_edges} edges), skipping visualization")
+        return
+    rasterize = n_edges >= RASTERIZE_EDGES_THRESHOLD
+    
     # Create figure
     fig, ax = plt.subplots(figsize=(16, 12))
     fig.patch.set_facecolor('white')
     
-    # Use spring layout for better visualization
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-    
-    # Draw nodes by type
-    for node_type, color in node_colors.items():
-        nodes = [node for node, ntype in node_types.items() if ntype == node_type]
-        if nodes:
-            node_size = 3000 if node_type == 'wallet' else 2500
-            nx.draw_networkx_nodes(
-                G, pos, nodelist=nodes,
-                node_color=color,
-                node_size=node_size,
-                alpha=0.9,
-                ax=ax
-            )
-    
-    # Draw edges
+    # Use spring layout for better visualization; large graphs use the
+    # multilevel layout, which needs only short refinement at fine levels
+    if G.number_of_nodes() > LBFGS_LAYOUT_THRESHOLD:
+        pos = _multilevel_layout(G)
+    else:
+        pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    
+    # Draw all nodes in one collection, colored and sized by type
+    node_list = list(node_types)
+    nx.draw_networkx_nodes(
+        G, pos, nodelist=node_list,
+        node_color=[node_colors[node_types[node]] for node in node_list],
+        node_size=[3000 if node_types[node] == 'wallet' else 2500 for node in node_list],
+        alpha=0.9,
+        ax=ax
+    )
+    
+    # Draw edges (dense graphs skip the per-edge arrow patches)
+    if rasterize:
+        arrow_kwargs = {'arrows': False}
+    else:
+        arrow_kwargs = {'arrows': True, 'arrowsize': 20, 'arrowstyle': '->'}
+    
     # Ownership edges (wallet -> contract)
-    ownership_edges = [(u, v) for u, v, d in G.edges(data=True) if d['relationship'] == 'owns']
-    nx.draw_networkx_edges(
+    ownership_artists = nx.draw_networkx_edges(
         G, pos,
         edgelist=ownership_edges,
         edge_color='#999',
         width=2,
         alpha=0.6,
-        arrows=True,
-        arrowsize=20,
-        arrowstyle='->',
-        ax=ax
+        ax=ax,
+        **arrow_kwargs
     )
     
     # Approval edges (contract -> target)
-    approval_edges = [(u, v) for u, v, d in G.edges(data=True) if d['relationship'] == 'approval']
-    nx.draw_networkx_edges(
+    approval_artists = nx.draw_networkx_edges(
         G, pos,
         edgelist=approval_edges,
         edge_color='#F44336',
         width=3,
         alpha=0.7,
-        arrows=True,
-        arrowsize=20,
-        arrowstyle='->',
-        ax=ax
+        ax=ax,
+        **arrow_kwargs
     )
     
+    # Dense graphs: edges are one LineCollection each, rasterized
+    if rasterize:
+        ownership_artists.set_rasterized(True)
+        approval_artists.set_rasterized(True)
+    
     # Draw labels
     labels = {node: node[:10] + '...' if len(node) > 10 else node for node in G.nodes()}
     nx.draw_networkx_labels(
@@ -138,11 +513,10 @@ def visualize_authority_graph(authority_data, output_file='authority_graph.png')
         ax=ax
     )
     
-    # Draw edge labels for approvals
-    edge_label_pos = {k: v for k, v in edge_labels.items() if k in approval_edges}
+    # Draw edge labels for approvals (labels are only recorded for approvals)
     nx.draw_networkx_edge_labels(
         G, pos,
-        edge_label_pos,
+        edge_labels,
         font_size=7,
         font_color='#333',
         bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8),
@@ -181,7 +555,8 @@ def visualize_authority_graph(authority_data, output_file='authority_graph.png')
     plt.tight_layout()
     
     # Save figure
-    plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
+    dpi = 150 if rasterize else 300
+    plt.savefig(output_file, dpi=dpi, bbox_inches='tight', facecolor='white')
     print(f"✅ Graph visualization saved to: {output_file}")
     
     # Show plot
@@ -251,7 +626,7 @@ if __name__ == "__main__":
     authority_graph = build_authority_graph(sample_events)
     
     print("\n📊 Authority Graph Data:")
-    print(json.dumps(authority_graph, indent=2))
+    print(_dumps(authority_graph))
     
     print("\n🎨 Creating visualization...")
     visualize_authority_graph(authority_graph)
@@ -2,7 +2,24 @@
 Setup configuration for PointZero Member C Authority Graph Builder
 """
 
-from setuptools import setup, find_packages # type: ignore
+from setuptools import setup, find_packages, Extension # type: ignore
+
+try:
+    from Cython.Build import cythonize # type: ignore
+except ImportError:
+    cythonize = None
+
+# Compile the builder module to a C extension when Cython is available.
+# The extension shadows the pure-Python module on import; if the build
+# fails (e.g. no C compiler) the pure-Python module is installed alone.
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [Extension("authority_graph_builder", ["src/authority_graph_builder.py"], optional=True)],
+        # Keep type hints advisory so the compiled module raises the same
+        # errors (e.g. ValueError for non-list input) as the pure one
+        compiler_directives={"language_level": 3, "annotation_typing": False},
+    )
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -18,6 +35,8 @@ setup(
     url="https://github.com/KeerthanaTV06/Liqufi-Hackathon",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    py_modules=["authority_graph_builder"],
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -22,7 +22,7 @@ function normalizeAmount(amount) {
   // Handle common unlimited approval patterns
   if (amountStr === "MAX_UINT" || 
       amountStr === "UNLIMITED" || 
-      amountStr.includes("115792089237316195423570985008687907853269984665640564039457584007913129639935")) {
+      amountStr === "115792089237316195423570985008687907853269984665640564039457584007913129639935") {
     return "unlimited";
   }
   
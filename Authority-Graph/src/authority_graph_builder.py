@@ -7,19 +7,245 @@ Pure transformation layer that converts authority events into normalized graph s
 - No inference: No risk scoring, no heuristics
 """
 
-from typing import List, Dict, Any, Optional
+import functools
+from itertools import groupby
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, NamedTuple
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+# Decimal form of type(uint256).max, the canonical unlimited approval amount
+MAX_UINT256_DECIMAL = "115792089237316195423570985008687907853269984665640564039457584007913129639935"
+
+# Fields every event must carry with a non-null value
+_REQUIRED = ("wallet", "contract", "authority_type", "target_entity", "block", "timestamp")
+
+# Optional event fields; events with other keys use the generic converter
+_OPTIONAL = ("amount", "tx_hash", "log_index")
+_KNOWN_FIELDS = frozenset(_REQUIRED + _OPTIONAL)
+
+# Batches larger than this take the pandas path when pandas is installed
+VECTORIZE_THRESHOLD = 256
+
+
+class _Edge(NamedTuple):
+    """
+    Compact edge record used while building; dicts are only made on output
+    
+    The leading fields are the sort key (absent tx_hash/log_index sort as
+    "" and 0); tx_hash and log_index keep None when absent from the event.
+    """
+    wallet: Any
+    block: int
+    tx_key: Any
+    log_index_key: int
+    timestamp: int
+    type: Any
+    contract: Any
+    target_entity: Any
+    amount: str
+    tx_hash: Any
+    log_index: Optional[int]
+
+
+# Wallet first, so one sort orders every wallet group
+_SORT_KEY = attrgetter("wallet", "block", "tx_key", "log_index_key", "timestamp")
+_WALLET_KEY = attrgetter("wallet")
+# Ordering of one wallet's edges
+_EDGE_ORDER_KEY = attrgetter("block", "tx_key", "log_index_key", "timestamp")
+
+
+def _missing_field(event: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the first required field that is absent or None, if any
+    
+    An event that is not a dict has none of the fields.
+    """
+    if not isinstance(event, dict):
+        return _REQUIRED[0]
+    for field in _REQUIRED:
+        if event.get(field) is None:
+            return field
+    return None
+
+
+def _edge_to_dict(edge: _Edge) -> Dict[str, Any]:
+    """
+    Materialize an edge record in the output schema
+    """
+    out = {
+        "type": edge.type,
+        "contract": edge.contract,
+        "target_entity": edge.target_entity,
+        "amount": edge.amount,
+        "block": edge.block,
+        "timestamp": edge.timestamp,
+        "revocation_possible": "UNKNOWN"
+    }
+    if edge.tx_hash is not None:
+        out["tx_hash"] = edge.tx_hash
+    if edge.log_index is not None:
+        out["log_index"] = edge.log_index
+    return out
+
+
+def _event_to_edge(event: Dict[str, Any]) -> _Edge:
+    """
+    Validate one event and convert it to an edge record
+    
+    Raises:
+        ValueError: If a required field is missing or None
+    """
+    try:
+        wallet, contract, authority_type, target_entity, block, timestamp = (
+            event["wallet"], event["contract"], event["authority_type"],
+            event["target_entity"], event["block"], event["timestamp"]
+        )
+    except (KeyError, TypeError):
+        # TypeError: the event is not a dict (e.g. a str or list)
+        raise ValueError(f"Event missing required field: {_missing_field(event)}") from None
+    if None in (wallet, contract, authority_type, target_entity, block, timestamp):
+        raise ValueError(f"Event missing required field: {_missing_field(event)}")
+    
+    # Optional fields (None when absent)
+    tx_hash = event.get("tx_hash")
+    log_index = event.get("log_index")
+    if log_index is not None and type(log_index) is not int:
+        log_index = int(log_index)
+    
+    # Coerce to int only when needed; the exact type check (not
+    # isinstance) still converts bools and other int subclasses
+    if type(block) is not int:
+        block = int(block)
+    if type(timestamp) is not int:
+        timestamp = int(timestamp)
+    
+    return _Edge(
+        wallet,
+        block,
+        "" if tx_hash is None else tx_hash,
+        0 if log_index is None else log_index,
+        timestamp,
+        authority_type,
+        contract,
+        target_entity,
+        normalize_amount(event.get("amount")),
+        tx_hash,
+        log_index
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_converter(has_amount: bool, has_tx_hash: bool, has_log_index: bool):
+    """
+    Generate a batch converter specialized for one event schema
+    
+    The generated function does the same work as _event_to_edge, with the
+    optional-field lookups resolved at generation time: fields known to be
+    absent become constants and present ones are read without .get().
+    The schema holds only known fields, so an event has exactly its keys
+    when it has the same number of keys and none of the reads fail; any
+    other event goes through the fallback converter, so results never
+    depend on the specialization.
+    
+    Args:
+        has_amount: Whether the schema has an amount field
+        has_tx_hash: Whether the schema has a tx_hash field
+        has_log_index: Whether the schema has a log_index field
+        
+    Returns:
+        Function (events, fallback) -> list of edge records
+    """
+    n_keys = len(_REQUIRED) + has_amount + has_tx_hash + has_log_index
+    lines = [
+        "def convert(events, fallback):",
+        "    edges = []",
+        "    append = edges.append",
+        "    for event in events:",
+        "        try:",
+        f"            if len(event) != {n_keys}:",
+        "                raise KeyError",
+        "            wallet, contract, authority_type, target_entity, block, timestamp = (",
+        "                event['wallet'], event['contract'], event['authority_type'],",
+        "                event['target_entity'], event['block'], event['timestamp'])",
+    ]
+    if has_amount:
+        lines.append("            amount = event['amount']")
+        amount = "normalize_amount(amount)"
+    else:
+        amount = "absent_amount"
+    if has_tx_hash:
+        lines.append("            tx_hash = event['tx_hash']")
+        tx_hash, tx_key = "tx_hash", "'' if tx_hash is None else tx_hash"
+    else:
+        tx_hash, tx_key = "None", "''"
+    if has_log_index:
+        lines.append("            log_index = event['log_index']")
+        log_index, log_index_key = "log_index", "0 if log_index is None else log_index"
+    else:
+        log_index, log_index_key = "None", "0"
+    lines += [
+        "        except (KeyError, TypeError):",
+        "            append(fallback(event))",
+        "            continue",
+        "        if None in (wallet, contract, authority_type, target_entity, block, timestamp):",
+        "            raise ValueError('Event missing required field: ' + str(_missing_field(event)))",
+    ]
+    if has_log_index:
+        lines += [
+            "        if log_index is not None and type(log_index) is not int:",
+            "            log_index = int(log_index)",
+        ]
+    lines += [
+        "        if type(block) is not int:",
+        "            block = int(block)",
+        "        if type(timestamp) is not int:",
+        "            timestamp = int(timestamp)",
+        f"        append(new_tuple(_Edge, (wallet, block, {tx_key}, {log_index_key}, timestamp,",
+        f"                                 authority_type, contract, target_entity, {amount}, {tx_hash}, {log_index})))",
+        "    return edges",
+    ]
+    namespace = {
+        "_Edge": _Edge,
+        # Skips the Python-level NamedTuple.__new__ frame
+        "new_tuple": tuple.__new__,
+        "_missing_field": _missing_field,
+        "normalize_amount": normalize_amount,
+        "absent_amount": normalize_amount(None),
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["convert"]
 
 
 def normalize_amount(amount: Any) -> str:
     """
     Normalize amount field to consistent string representation
     
+    Memoized: approval streams repeat a handful of amount values, so the
+    common cases resolve to a cache hit. Unhashable amounts (e.g. lists)
+    are normalized without the cache.
+    
     Args:
         amount: Raw amount value (string, number, or None)
         
     Returns:
         Normalized amount as string
     """
+    try:
+        return _normalize_amount_cached(amount)
+    except TypeError:
+        return _normalize_amount(amount)
+
+
+def _normalize_amount(amount: Any) -> str:
+    """
+    Uncached body of normalize_amount
+    """
     if amount is None:
         return "unlimited"
     
@@ -28,7 +254,7 @@ def normalize_amount(amount: Any) -> str:
     # Handle common unlimited approval patterns
     if (amount_str == "MAX_UINT" or 
         amount_str == "UNLIMITED" or 
-        "115792089237316195423570985008687907853269984665640564039457584007913129639935" in amount_str):
+        amount_str == MAX_UINT256_DECIMAL):
         return "unlimited"
     
     # Handle zero as string
@@ -39,6 +265,9 @@ def normalize_amount(amount: Any) -> str:
     return str(amount)
 
 
+_normalize_amount_cached = functools.lru_cache(maxsize=4096, typed=True)(_normalize_amount)
+
+
 def build_authority_graph(events: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """
     Build authority graph from array of authority events
@@ -47,7 +276,9 @@ def build_authority_graph(events: List[Dict[str, Any]]) -> Dict[str, Dict[str, A
         events: List of authority transition events
         
     Returns:
-        Dictionary mapping wallet addresses to their authority graphs
+        Dictionary mapping wallet addresses to their authority graphs, in
+        sorted wallet order (order of first appearance when the wallets
+        cannot be compared, e.g. a mix of int and str)
         
     Raises:
         ValueError: If input is invalid or required fields are missing
@@ -59,62 +290,181 @@ def build_authority_graph(events: List[Dict[str, Any]]) -> Dict[str, Dict[str, A
     if len(events) == 0:
         return {}
     
-    # Group events by wallet
-    wallet_groups: Dict[str, List[Dict[str, Any]]] = {}
+    if pd is not None and len(events) > VECTORIZE_THRESHOLD:
+        results = _build_vectorized(events)
+        if results is not None:
+            return results
     
-    for event in events:
-        # Validate required fields
-        required_fields = ["wallet", "contract", "authority_type", "target_entity", "block", "timestamp"]
-        for field in required_fields:
-            if field not in event or event[field] is None:
-                raise ValueError(f"Event missing required field: {field}")
-        
-        wallet = event["wallet"]
-        
-        if wallet not in wallet_groups:
-            wallet_groups[wallet] = []
-        
-        # Build normalized edge
-        edge = {
-            "type": event["authority_type"],
-            "contract": event["contract"],
-            "target_entity": event["target_entity"],
-            "amount": normalize_amount(event.get("amount")),
-            "block": int(event["block"]),
-            "timestamp": int(event["timestamp"]),
-            "revocation_possible": "UNKNOWN"
-        }
-        
-        # Add optional fields if present
-        if "tx_hash" in event and event["tx_hash"] is not None:
-            edge["tx_hash"] = event["tx_hash"]
-        if "log_index" in event and event["log_index"] is not None:
-            edge["log_index"] = int(event["log_index"])
-        
-        wallet_groups[wallet].append(edge)
-    
-    # Sort edges within each wallet group by block ascending
-    # Secondary sort by tx_hash and log_index for determinism
-    for wallet in wallet_groups:
-        wallet_groups[wallet].sort(key=lambda x: (
-            x["block"],
-            x.get("tx_hash", ""),
-            x.get("log_index", 0),
-            x["timestamp"]
-        ))
+    # Convert events to edge records; the first event's schema selects a
+    # converter specialized for it (other events fall back to the generic one)
+    first = events[0]
+    if type(first) is dict and _KNOWN_FIELDS.issuperset(first) and all(field in first for field in _REQUIRED):
+        convert = _compile_converter("amount" in first, "tx_hash" in first, "log_index" in first)
+        edges = convert(events, _event_to_edge)
+    else:
+        edges = [_event_to_edge(event) for event in events]
+    
+    # One stable sort over all edges: wallet, then block ascending, then
+    # tx_hash and log_index for determinism; wallet groups are contiguous.
+    # sorted() leaves the input order intact if the sort fails
+    try:
+        edges = sorted(edges, key=_SORT_KEY)
+    except TypeError:
+        # Wallets of different types (e.g. int and str) cannot be ordered
+        # against each other: group first, then sort within each wallet
+        return _build_grouped(edges)
     
     # Build output format
     results = {}
     
-    for wallet, edges in wallet_groups.items():
+    for wallet, group in groupby(edges, key=_WALLET_KEY):
         results[wallet] = {
             "wallet": wallet,
-            "authority_edges": edges
+            "authority_edges": [_edge_to_dict(edge) for edge in group]
         }
     
     return results
 
 
+def _build_grouped(edges: List[_Edge]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the output wallet by wallet, for wallets that cannot be sorted
+    
+    Wallets appear in order of first appearance; each wallet's edges get
+    the same ordering as the single-sort path.
+    """
+    wallet_groups: Dict[Any, List[_Edge]] = {}
+    for edge in edges:
+        wallet_groups.setdefault(edge.wallet, []).append(edge)
+    
+    results = {}
+    for wallet, group in wallet_groups.items():
+        group.sort(key=_EDGE_ORDER_KEY)
+        results[wallet] = {
+            "wallet": wallet,
+            "authority_edges": [_edge_to_dict(edge) for edge in group]
+        }
+    return results
+
+
+def _build_vectorized(events: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build authority graph for a large batch using pandas column operations
+    
+    Produces exactly the same output as the per-event path: validation,
+    amount normalization and sorting run over whole columns, and only the
+    final edge dicts are assembled row by row.
+    
+    Args:
+        events: List of authority transition events
+        
+    Returns:
+        Dictionary mapping wallet addresses to their authority graphs, or
+        None if the batch needs the per-event path: an event that is not a
+        dict, a wallet that is not a str, or an integer field that does
+        not fit in int64
+        
+    Raises:
+        ValueError: If required fields are missing
+    """
+    # The per-event path defines the errors for non-dict events and the
+    # grouping of non-str wallets (groupby would drop a NaN wallet)
+    if not all(isinstance(event, dict) for event in events):
+        return None
+    
+    # Columns are read with .get(), so an absent field is None exactly as
+    # on the per-event path; pandas would fill it with NaN, which could not
+    # be told apart from an explicit NaN value
+    columns = {field: [event.get(field) for event in events] for field in _REQUIRED + _OPTIONAL}
+    if not all(type(wallet) is str for wallet in columns["wallet"]):
+        return None
+    df = pd.DataFrame(columns, dtype=object)
+    
+    # Validate required fields, reporting the first offending event and field
+    missing = np.column_stack([_none_mask(df[field]) for field in _REQUIRED])
+    if missing.any():
+        row = missing.any(axis=1).argmax()
+        raise ValueError(f"Event missing required field: {_REQUIRED[missing[row].argmax()]}")
+    
+    # Normalize amounts (same rules as normalize_amount; only None is
+    # unlimited, a NaN amount stays "nan")
+    amount = df["amount"]
+    amount_str = amount.astype(str)
+    unlimited = (
+        _none_mask(amount)
+        | amount_str.str.upper().isin(["MAX_UINT", "UNLIMITED"]).to_numpy()
+        | (amount_str == MAX_UINT256_DECIMAL).to_numpy()
+    )
+    
+    has_tx_hash = ~_none_mask(df["tx_hash"])
+    has_log_index = ~_none_mask(df["log_index"])
+    
+    try:
+        block = df["block"].astype("int64")
+        timestamp = df["timestamp"].astype("int64")
+        log_index = df["log_index"].where(has_log_index, 0).astype("int64")
+    except OverflowError:
+        # Wider than 64 bits; the per-event path keeps Python ints
+        return None
+    
+    frame = pd.DataFrame({
+        "wallet": df["wallet"],
+        "type": df["authority_type"],
+        "contract": df["contract"],
+        "target_entity": df["target_entity"],
+        "amount": amount_str.mask(unlimited, "unlimited"),
+        "block": block,
+        "timestamp": timestamp,
+        "has_tx_hash": has_tx_hash,
+        "tx_hash": df["tx_hash"].where(has_tx_hash, ""),
+        "has_log_index": has_log_index,
+        "log_index": log_index,
+    })
+    
+    # Single stable sort: wallet, then the per-wallet ordering of the event path
+    frame = frame.sort_values(
+        ["wallet", "block", "tx_hash", "log_index", "timestamp"], kind="stable"
+    ).reset_index(drop=True)
+    
+    edges = []
+    for (edge_type, contract, target_entity, amount_out, block, timestamp,
+         has_tx, tx_hash, has_li, log_index) in zip(
+            frame["type"].tolist(), frame["contract"].tolist(),
+            frame["target_entity"].tolist(), frame["amount"].tolist(),
+            frame["block"].tolist(), frame["timestamp"].tolist(),
+            frame["has_tx_hash"].tolist(), frame["tx_hash"].tolist(),
+            frame["has_log_index"].tolist(), frame["log_index"].tolist()):
+        edge = {
+            "type": edge_type,
+            "contract": contract,
+            "target_entity": target_entity,
+            "amount": amount_out,
+            "block": block,
+            "timestamp": timestamp,
+            "revocation_possible": "UNKNOWN"
+        }
+        if has_tx:
+            edge["tx_hash"] = tx_hash
+        if has_li:
+            edge["log_index"] = log_index
+        edges.append(edge)
+    
+    return {
+        wallet: {
+            "wallet": wallet,
+            "authority_edges": [edges[i] for i in positions]
+        }
+        for wallet, positions in frame.groupby("wallet", sort=True).indices.items()
+    }
+
+
+def _none_mask(column) -> "np.ndarray":
+    """
+    Boolean array marking the None values of a column (NaN is not None)
+    """
+    return np.fromiter((value is None for value in column), dtype=bool, count=len(column))
+
+
 def build_single_wallet_graph(events: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Build authority graph for a single wallet (convenience method)
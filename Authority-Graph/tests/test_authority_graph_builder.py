@@ -60,6 +60,7 @@ def test_amount_normalization():
     assert normalize_amount(0) == "0", "Zero number"
     assert normalize_amount("1000000") == "1000000", "Regular amount string"
     assert normalize_amount(1000000) == "1000000", "Regular amount number"
+    assert normalize_amount([1, 2]) == "[1, 2]", "Unhashable amount"
     print("✓ Amount normalization")
 
 
@@ -260,6 +261,13 @@ def test_validation_errors():
     except ValueError:
         pass
     
+    for event in ["0xABC", ["wallet"], 5]:
+        try:
+            build_authority_graph([event])
+            assert False, f"Should reject non-dict event {event!r}"
+        except ValueError as e:
+            assert "wallet" in str(e)
+    
     print("✓ Validation errors")
 
 
@@ -314,6 +322,126 @@ def test_determinism():
     print("✓ Determinism test (same input = same output)")
 
 
+def test_large_batch_matches_small_batches():
+    """Test large batches (vectorized when pandas is available) match per-wallet builds"""
+    amounts = ["MAX_UINT", None, "0", 0, 1000000, "unlimited", "500", float("nan"), [1, 2]]
+    events = []
+    for i in range(600):
+        event = {
+            "wallet": f"0xW{i % 7}",
+            "contract": f"0xC{i % 11}",
+            "authority_type": "token_approval",
+            "target_entity": f"0xT{i % 5}",
+            "amount": amounts[i % len(amounts)],
+            "block": 100 + (i * 37) % 50,
+            "timestamp": 1712345678 + i
+        }
+        if i % 3:
+            event["tx_hash"] = f"0xTX{i % 4}"
+        if i % 4:
+            event["log_index"] = i % 6
+        events.append(event)
+    
+    result = build_authority_graph(events)
+    
+    assert len(result) == 7, "Seven wallets in output"
+    for wallet in result:
+        wallet_events = [e for e in events if e["wallet"] == wallet]
+        assert result[wallet] == build_single_wallet_graph(wallet_events), \
+            f"Large batch matches per-wallet build for {wallet}"
+    
+    # NaN is an amount value, not a missing one
+    nan_amounts = [
+        edge["amount"]
+        for graph in result.values() for edge in graph["authority_edges"]
+    ]
+    nan_events = sum(1 for e in events if e["amount"] != e["amount"])
+    assert nan_amounts.count("nan") == nan_events, "NaN amounts kept as 'nan'"
+    
+    # Integers wider than 64 bits
+    wide = [dict(event) for event in events]
+    wide[0]["block"] = 2**70
+    wide[1]["timestamp"] = 2**64
+    wide[2]["log_index"] = -2**70
+    result = build_authority_graph(wide)
+    for wallet in result:
+        wallet_events = [e for e in wide if e["wallet"] == wallet]
+        assert result[wallet] == build_single_wallet_graph(wallet_events), \
+            f"Large batch with wide integers matches per-wallet build for {wallet}"
+    
+    # A NaN wallet is a wallet value, not a missing one
+    nan_wallet = [dict(event) for event in events]
+    nan_wallet[0]["wallet"] = float("nan")
+    result = build_authority_graph(nan_wallet)
+    assert sum(len(graph["authority_edges"]) for graph in result.values()) == 600, \
+        "No events dropped"
+    
+    # Non-dict events raise the same error as in small batches
+    try:
+        build_authority_graph(events[:-1] + ["0xABC"])
+        assert False, "Should reject non-dict event"
+    except ValueError as e:
+        assert "wallet" in str(e)
+    print("✓ Large batch matches per-wallet builds")
+
+
+def test_mixed_event_schemas():
+    """Test events whose keys differ from the first event's schema"""
+    base = {
+        "wallet": "0xA",
+        "contract": "0xC",
+        "authority_type": "token_approval",
+        "target_entity": "0xT",
+        "timestamp": 1712345678
+    }
+    events = [
+        {**base, "block": 1, "amount": "MAX_UINT", "tx_hash": "0x1", "log_index": "2"},
+        {**base, "block": 2},
+        {**base, "block": "3", "amount": "7", "chain": "mainnet"},
+        {**base, "block": 4, "amount": None, "tx_hash": None, "log_index": 0}
+    ]
+    
+    edges = build_authority_graph(events)["0xA"]["authority_edges"]
+    
+    assert [edge["block"] for edge in edges] == [1, 2, 3, 4], "All events converted"
+    assert edges[0]["log_index"] == 2, "log_index coerced to int"
+    assert "tx_hash" not in edges[1] and "log_index" not in edges[1], "Absent fields omitted"
+    assert edges[1]["amount"] == "unlimited", "Absent amount normalized"
+    assert edges[2]["amount"] == "7", "Amount kept for event with extra keys"
+    assert "tx_hash" not in edges[3] and edges[3]["log_index"] == 0, "None tx_hash omitted"
+    
+    try:
+        build_authority_graph([events[0], {**base, "block": None}])
+        assert False, "Should raise ValueError"
+    except ValueError as e:
+        assert "block" in str(e)
+    
+    print("✓ Mixed event schemas handled")
+
+
+def test_mixed_wallet_types():
+    """Test wallets of different types are grouped instead of compared"""
+    base = {
+        "contract": "0xC",
+        "authority_type": "token_approval",
+        "target_entity": "0xT",
+        "timestamp": 1712345678
+    }
+    events = [
+        {**base, "wallet": "0xB", "block": 3},
+        {**base, "wallet": 7, "block": 2},
+        {**base, "wallet": "0xB", "block": 1},
+        {**base, "wallet": 7, "block": 1}
+    ]
+    
+    result = build_authority_graph(events)
+    
+    assert list(result) == ["0xB", 7], "Wallets in order of first appearance"
+    assert [edge["block"] for edge in result["0xB"]["authority_edges"]] == [1, 3]
+    assert [edge["block"] for edge in result[7]["authority_edges"]] == [1, 2]
+    print("✓ Mixed wallet types grouped")
+
+
 if __name__ == "__main__":
     print("\n🧪 Running Authority Graph Builder Tests\n")
     
@@ -328,6 +456,9 @@ if __name__ == "__main__":
         test_validation_errors()
         test_single_wallet_graph()
         test_determinism()
+        test_large_batch_matches_small_batches()
+        test_mixed_event_schemas()
+        test_mixed_wallet_types()
         
         print("\n✅ All tests passed!\n")
     except AssertionError as e:
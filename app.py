@@ -1,14 +1,41 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
-import json
-import subprocess
-import sys
-import os
-
-# --- Path setup ---
-PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-VERDICT_PATH = os.path.join(
-    PROJECT_ROOT, "backend", "data", "irreversibility_verdict.json"
-)
+
+from backend.analyze_wallet import run_analysis
+
+
+# Seconds between checks for progress while an analysis runs
+POLL_INTERVAL = 0.2
+
+# Triggered rules listed in the details expander (earliest first)
+MAX_LISTED_RULES = 10
+
+# Progress stages reported by run_analysis, as shown in the status box
+STAGE_LABELS = {
+    "validating": "Validating wallet address",
+    "fetching": "Fetching authority events",
+    "building graph": "Building authority graph",
+    "evaluating rules": "Evaluating irreversibility rules",
+    "writing verdict": "Writing verdict",
+}
+
+
+@st.cache_resource
+def _executor() -> ThreadPoolExecutor:
+    """One worker pool per server process, shared by all sessions."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="pointzero-analysis")
+
+
+@st.cache_data(ttl=300, max_entries=512, show_spinner=False)
+def _analyze_cached(wallet_key: str, detailed: bool, _progress=None) -> dict:
+    """Run the analysis once per normalized wallet; repeats hit the cache for 5 minutes."""
+    return run_analysis(
+        wallet_key, verbose=False, detailed=detailed,
+        progress=_progress, top_k=MAX_LISTED_RULES,
+    )
+
 
 st.set_page_config(
     page_title="PointZero",
@@ -33,55 +60,55 @@ wallet = st.text_input(
     placeholder="0xABC...123"
 )
 
+# Without details, rule evaluation stops at the earliest breach
+detailed = st.checkbox("Include extended analysis details", value=True)
+
 analyze = st.button("🔍 Analyze Wallet", use_container_width=True)
+refresh = st.button("🔄 Refresh (ignore cached result)", use_container_width=True)
 
 st.divider()
 
-if analyze:
+if analyze or refresh:
     if wallet == "":
         st.warning("⚠️ Please enter a wallet address")
     else:
-        # --- Run backend analysis ---
-        with st.spinner("🔄 Running irreversibility analysis..."):
-            try:
-                result = subprocess.run(
-                    [
-                        sys.executable,
-                        os.path.join(PROJECT_ROOT, "backend", "analyze_wallet.py"),
-                        wallet,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    timeout=30,
-                    cwd=PROJECT_ROOT,
-                )
-
-                if result.returncode != 0:
-                    st.error(
-                        f"❌ Backend error (exit code {result.returncode}):\n"
-                        f"{result.stderr.strip()}"
-                    )
-                    st.stop()
-
-            except subprocess.TimeoutExpired:
-                st.error("❌ Analysis timed out (30s limit).")
-                st.stop()
-            except FileNotFoundError:
-                st.error("❌ Backend not found. Ensure backend/ directory exists.")
-                st.stop()
-
-        # --- Read verdict JSON ---
-        try:
-            with open(VERDICT_PATH, "r", encoding="utf-8") as f:
-                verdict_data = json.load(f)
-        except FileNotFoundError:
-            st.error("❌ Verdict file not found. Backend may not have run correctly.")
+        # Addresses are case-insensitive, so "0xABC…" and "0xabc…" share an entry
+        wallet_key = wallet.strip().lower()
+        if refresh:
+            _analyze_cached.clear(wallet_key, True)
+            _analyze_cached.clear(wallet_key, False)
+
+        # --- Run backend analysis (background thread, cached) ---
+        # The worker reports stages through the queue; a cache hit
+        # finishes without reporting any
+        stages = queue.Queue()
+        future = _executor().submit(_analyze_cached, wallet_key, detailed, stages.put)
+
+        with st.status("🔄 Running irreversibility analysis...") as status:
+            while not future.done() or not stages.empty():
+                try:
+                    stage = stages.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                label = STAGE_LABELS.get(stage, stage)
+                status.update(label=f"🔄 {label}...")
+                st.write(label)
+
+            error = future.exception()
+            if error is None:
+                status.update(label="✅ Analysis complete", state="complete")
+            else:
+                status.update(label="Analysis failed", state="error")
+
+        if isinstance(error, ValueError):
+            st.error(f"❌ Validation Error: {error}")
             st.stop()
-        except json.JSONDecodeError:
-            st.error("❌ Verdict file is corrupted. Please re-run analysis.")
+        elif error is not None:
+            st.error(f"❌ Analysis Error: {error}")
             st.stop()
 
+        verdict_data = future.result()
+
         # --- Display results (original rendering logic preserved) ---
         st.markdown("### 🧾 Analysis Result")
 
@@ -117,6 +144,11 @@ if analyze:
 
                 if details.get("triggered_rules"):
                     st.markdown("**Triggered Rules:**")
+                    if details.get("total_breaches", 0) > len(details["triggered_rules"]):
+                        st.caption(
+                            f"Showing the earliest {len(details['triggered_rules'])} "
+                            f"of {details['total_breaches']} breaches."
+                        )
                     for rule in details["triggered_rules"]:
                         severity_icon = {
                             "FATAL": "💀", "CRITICAL": "🔴",
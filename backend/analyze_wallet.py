@@ -1,11 +1,3 @@
-import sys
-import io
-import os
-
-# Force UTF-8 encoding for stdout and stderr to prevent Windows console issues with emojis
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
-
 """
 PointZero Wallet Analyzer — CLI Entry Point
 =============================================
@@ -18,8 +10,15 @@ Orchestrates the full dynamic analysis pipeline:
 
 Usage:
     python backend/analyze_wallet.py <wallet_address>
+
+The pipeline itself is run_analysis(), which the Streamlit app calls
+in-process.
 """
 
+import sys
+import io
+import os
+
 # Ensure the project root is on the path so imports resolve correctly
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -29,9 +28,96 @@ from backend.liquify_client import LiquifyClient
 from backend.graph_builder import GraphBuilder, save_graph_to_file
 from backend.security import validate_wallet_address
 
+
+def _silent(*args, **kwargs):
+    """Discard progress output."""
+
+
+def run_analysis(
+    raw_wallet: str,
+    verbose: bool = True,
+    output_format: str = "json",
+    detailed: bool = True,
+    progress=None,
+    top_k: int = None,
+) -> dict:
+    """
+    Run the analysis pipeline for one wallet and return the verdict.
+
+    The verdict and the authority graph are still written to backend/data
+    for debugging.
+
+    Args:
+        raw_wallet: Wallet address as entered by the user.
+        verbose: Print progress to stdout.
+        output_format: Format of the written files, "json" or "msgpack".
+        detailed: Evaluate every rule and include 'details' in the verdict.
+                  When False, rule evaluation stops at the earliest breach.
+        progress: Optional callable, called with a short stage name
+                  ("validating", "fetching", "building graph",
+                  "evaluating rules", "writing verdict") as each stage starts.
+        top_k: List at most this many (earliest) triggered rules in the
+               verdict details.
+
+    Returns:
+        The verdict dict.
+
+    Raises:
+        ValueError: If the wallet address is invalid.
+    """
+    log = print if verbose else _silent
+    stage = progress or _silent
+
+    log(f"🔍 PointZero — Starting Dynamic Analysis for: {raw_wallet}")
+    log("=" * 60)
+
+    # 1. Validate Wallet
+    stage("validating")
+    wallet_address = validate_wallet_address(raw_wallet)
+    log(f"✅ Wallet validated: {wallet_address}")
+
+    # 2. Fetch Events (LiquifyClient)
+    stage("fetching")
+    log("⏳ Fetching authority events form Liquify (Mock)...")
+    client = LiquifyClient()
+    events = client.fetch_authority_events(wallet_address)
+    log(f"✅ Fetched {len(events)} raw events.")
+
+    # 3. Build Graph (GraphBuilder)
+    stage("building graph")
+    log("⚙️ Building Authority Graph...")
+    builder = GraphBuilder()
+    graph = builder.build_authority_graph(wallet_address, events)
+    
+    # Save graph for frontend reference / debugging
+    graph_path = save_graph_to_file(graph, format=output_format)
+    log(f"💾 Authority Graph saved to: {graph_path}")
+
+    # 4. Analyze Graph (IrreversibilityEngine)
+    stage("evaluating rules")
+    log("🧠 Running Irreversibility Engine...")
+    engine = IrreversibilityEngine()
+    # Note: We pass the in-memory graph directly; the address was
+    # validated in step 1, so the engine does not re-validate it
+    verdict = engine._analyze_graph_fast(
+        wallet_address, graph, detailed=detailed, top_k=top_k
+    )
+
+    # 5. Write Verdict
+    stage("writing verdict")
+    output_path = write_verdict(verdict, format=output_format)
+    log(f"\n📄 Verdict written to: {output_path}")
+
+    return verdict
+
+
 def main():
     """Run the full PointZero dynamic analysis pipeline."""
 
+    # Force UTF-8 encoding for stdout and stderr to prevent Windows console issues with emojis
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
     # --- Parse CLI argument ---
     if len(sys.argv) < 2:
         print("Usage: python backend/analyze_wallet.py <wallet_address>")
@@ -40,37 +126,7 @@ def main():
     raw_wallet = sys.argv[1]
 
     try:
-        print(f"🔍 PointZero — Starting Dynamic Analysis for: {raw_wallet}")
-        print("=" * 60)
-
-        # 1. Validate Wallet
-        wallet_address = validate_wallet_address(raw_wallet)
-        print(f"✅ Wallet validated: {wallet_address}")
-
-        # 2. Fetch Events (LiquifyClient)
-        print("⏳ Fetching authority events form Liquify (Mock)...")
-        client = LiquifyClient()
-        events = client.fetch_authority_events(wallet_address)
-        print(f"✅ Fetched {len(events)} raw events.")
-
-        # 3. Build Graph (GraphBuilder)
-        print("⚙️ Building Authority Graph...")
-        builder = GraphBuilder()
-        graph = builder.build_authority_graph(wallet_address, events)
-        
-        # Save graph for frontend reference / debugging
-        graph_path = save_graph_to_file(graph)
-        print(f"💾 Authority Graph saved to: {graph_path}")
-
-        # 4. Analyze Graph (IrreversibilityEngine)
-        print("🧠 Running Irreversibility Engine...")
-        engine = IrreversibilityEngine()
-        # Note: We pass the in-memory graph directly
-        verdict = engine.analyze_graph(wallet_address, graph)
-
-        # 5. Write Verdict
-        output_path = write_verdict(verdict)
-        print(f"\n📄 Verdict written to: {output_path}")
+        verdict = run_analysis(raw_wallet)
 
         # --- Print Summary ---
         print(f"\n{'=' * 60}")
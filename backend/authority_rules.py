@@ -18,10 +18,29 @@ Rules operate on authority_edges from the authority graph:
     }
 """
 
+import atexit
+import heapq
+import os
+import threading
+from collections import defaultdict
+from operator import itemgetter
+from typing import Optional
+
+
 # --- Constants ---
 
+# Opt-in: with POINTZERO_PARALLEL_RULES=1, graphs with more edges than
+# PARALLEL_EDGE_THRESHOLD are evaluated across worker processes. Off by
+# default because pickling edges to the workers costs more than the
+# built-in detectors do; worth enabling only for expensive detectors.
+# Workers are spawned, so a script that enables it needs the usual
+# `if __name__ == "__main__":` guard.
+PARALLEL_RULES_ENV = "POINTZERO_PARALLEL_RULES"
+PARALLEL_EDGE_THRESHOLD = 2000
+
 # Solidity type(uint256).max = 2^256 - 1
-MAX_UINT256 = str(2**256 - 1)
+MAX_UINT256_INT = 2**256 - 1
+MAX_UINT256 = str(MAX_UINT256_INT)
 
 # Common representations of unlimited/max approval amounts
 UNLIMITED_INDICATORS = frozenset({
@@ -35,10 +54,14 @@ UNLIMITED_INDICATORS = frozenset({
     "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",
 })
 
+# Amounts of any other length cannot be an indicator
+_INDICATOR_MIN_LEN = min(map(len, UNLIMITED_INDICATORS))
+_INDICATOR_MAX_LEN = max(map(len, UNLIMITED_INDICATORS))
+
 
 # --- Rule Definitions ---
 
-IRREVERSIBILITY_RULES = [
+IRREVERSIBILITY_RULES = (
     {
         "id": "RULE_001",
         "name": "Unlimited Token Approval (MAX_UINT256)",
@@ -83,7 +106,7 @@ IRREVERSIBILITY_RULES = [
         "edge_type": "role_grant",
         "severity": "HIGH",
     },
-]
+)
 
 
 # --- Detection Functions ---
@@ -97,8 +120,18 @@ def _detect_unlimited_approval(edge: dict) -> bool:
     if edge.get("type") != "token_approval":
         return False
 
-    amount = str(edge.get("amount", "")).strip()
-    return amount in UNLIMITED_INDICATORS
+    amount = edge.get("amount", "")
+    if type(amount) is int:
+        # Integer amounts (e.g. raw uint256 from JSON) compare numerically
+        return amount == MAX_UINT256_INT
+    if type(amount) is not str:
+        amount = str(amount)
+
+    amount = amount.strip()
+    return (
+        _INDICATOR_MIN_LEN <= len(amount) <= _INDICATOR_MAX_LEN
+        and amount in UNLIMITED_INDICATORS
+    )
 
 
 def _detect_proxy_admin_transfer(edge: dict) -> bool:
@@ -135,34 +168,61 @@ def _detect_ownership_transfer(edge: dict) -> bool:
     )
 
 
-def _detect_role_grant_without_revoke(edge: dict, all_edges: list) -> bool:
+def _role_key(edge: dict) -> tuple:
+    """Key that pairs a role_grant with the role_revoke edges cancelling it."""
+    return (
+        edge.get("role", ""),
+        edge.get("grantee", edge.get("spender", "")),
+        edge.get("contract", ""),
+    )
+
+
+def _build_revoke_index(all_edges: list) -> dict:
+    """
+    Map each (role, grantee, contract) to its latest role_revoke block.
+
+    A grant is cancelled by any later revoke of the same key, which holds
+    exactly when the latest revoke is later than the grant.
+    """
+    index = {}
+    for other in all_edges:
+        if not isinstance(other, dict) or other.get("type") != "role_revoke":
+            continue
+        block = other.get("block", 0)
+        try:
+            latest = index.get(_role_key(other))
+            if latest is None or block > latest:
+                index[_role_key(other)] = block
+        except TypeError:
+            continue  # Unhashable or incomparable fields cannot match a grant
+    return index
+
+
+def _detect_role_grant_without_revoke(edge: dict, revoke_index: dict) -> bool:
     """
     Detect if a role was granted without a corresponding revoke.
 
-    Scans all edges for a matching role_revoke that cancels this grant.
-    If no revoke is found, the role grant is an open authority leak.
+    Looks up the latest matching role_revoke in the revoke index built by
+    _build_revoke_index(). If no revoke follows the grant, the role grant
+    is an open authority leak.
     """
     if edge.get("type") != "role_grant":
         return False
 
-    role = edge.get("role", "")
-    grantee = edge.get("grantee", edge.get("spender", ""))
-    contract = edge.get("contract", "")
+    role, grantee, contract = key = _role_key(edge)
     grant_block = edge.get("block", 0)
 
     if not role or not grantee:
         return False
 
     # Search for a corresponding revoke AFTER this grant
-    for other in all_edges:
-        if (
-            other.get("type") == "role_revoke"
-            and other.get("role", "") == role
-            and other.get("grantee", other.get("spender", "")) == grantee
-            and other.get("contract", "") == contract
-            and other.get("block", 0) > grant_block
-        ):
-            return False  # Role was revoked — not an open leak
+    try:
+        latest_revoke = revoke_index.get(key)
+    except TypeError:
+        latest_revoke = None
+
+    if latest_revoke is not None and latest_revoke > grant_block:
+        return False  # Role was revoked — not an open leak
 
     return True  # No revoke found — open authority leak
 
@@ -173,19 +233,49 @@ _DETECTORS = {
     "token_approval": _detect_unlimited_approval,
     "proxy_admin_transfer": _detect_proxy_admin_transfer,
     "ownership_transfer": _detect_ownership_transfer,
-    # role_grant uses a special signature (needs all_edges), handled separately
+    # role_grant uses a special signature (needs the revoke index), handled separately
+}
+
+# Rules grouped by the edge type they apply to, in IRREVERSIBILITY_RULES order
+_RULES_BY_TYPE = defaultdict(list)
+for _rule in IRREVERSIBILITY_RULES:
+    _RULES_BY_TYPE[_rule["edge_type"]].append(_rule)
+del _rule
+_RULES_BY_TYPE = {edge_type: tuple(rules) for edge_type, rules in _RULES_BY_TYPE.items()}
+
+_RULES_BY_ID = {rule["id"]: rule for rule in IRREVERSIBILITY_RULES}
+
+# Leading fields of each rule's triggered record, keyed by rule id;
+# copied on a match (several rules may share an edge type)
+_RULE_SNAPSHOTS = {
+    rule["id"]: {
+        "rule_id": rule["id"],
+        "rule_name": rule["name"],
+        "severity": rule["severity"],
+        "description": rule["description"],
+    }
+    for rule in IRREVERSIBILITY_RULES
 }
 
+# Sort key for triggered records (every record has "block")
+_BLOCK_KEY = itemgetter("block")
+
+# Worker pool for large graphs, created on first use; the lock keeps
+# concurrent analyses (e.g. the app's worker threads) from creating several
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
 
 # --- Public API ---
 
-def evaluate_rules(wallet: str, authority_edges: list) -> list:
+def evaluate_rules(wallet: str, authority_edges: list, top_k: Optional[int] = None) -> list:
     """
     Evaluate all irreversibility rules against a wallet's authority edges.
 
     Args:
         wallet: Validated wallet address.
         authority_edges: List of authority edge dicts from the graph.
+        top_k: If set, return only the top_k earliest breaches.
 
     Returns:
         List of triggered rule dicts, each containing:
@@ -195,41 +285,202 @@ def evaluate_rules(wallet: str, authority_edges: list) -> list:
 
         Sorted by block number (earliest breach first).
     """
+    return earliest_triggered(find_triggered_rules(wallet, authority_edges), top_k)
+
+
+def find_triggered_rules(wallet: str, authority_edges: list) -> list:
+    """
+    Evaluate all irreversibility rules, leaving matches in edge order.
+
+    Args:
+        wallet: Validated wallet address.
+        authority_edges: List of authority edge dicts from the graph.
+
+    Returns:
+        List of triggered rule dicts (same format as evaluate_rules),
+        unsorted.
+    """
     if not isinstance(authority_edges, list):
         return []
 
-    triggered = []
+    workers = os.cpu_count() or 1
+    if (
+        len(authority_edges) > PARALLEL_EDGE_THRESHOLD
+        and workers > 1
+        and _parallel_enabled()
+    ):
+        triggered = _evaluate_parallel(authority_edges, workers)
+    else:
+        triggered = [
+            _triggered_record(edge, rule)
+            for _, edge, rule in _iter_matches(authority_edges, authority_edges)
+        ]
+
+    return triggered
+
+
+def earliest_triggered(triggered: list, top_k: Optional[int] = None) -> list:
+    """
+    Order triggered rules earliest breach first.
+
+    Ties keep their order from find_triggered_rules. With top_k, only the
+    top_k earliest are selected (O(N log K)) instead of sorting them all.
+
+    Args:
+        triggered: Triggered rule dicts from find_triggered_rules
+                   (sorted in place when top_k is None).
+        top_k: Number of breaches to keep (at least 1), or None for all.
 
-    for edge in authority_edges:
+    Returns:
+        The ordered list of triggered rule dicts.
+
+    Raises:
+        ValueError: If top_k is less than 1.
+    """
+    if top_k is not None:
+        if top_k < 1:
+            raise ValueError(f"top_k must be at least 1, got {top_k}.")
+        return heapq.nsmallest(top_k, triggered, key=_BLOCK_KEY)
+
+    # Deterministic ordering: earliest breach first
+    triggered.sort(key=_BLOCK_KEY)
+    return triggered
+
+
+def evaluate_rules_first(wallet: str, authority_edges: list) -> Optional[dict]:
+    """
+    Find only the earliest triggered rule.
+
+    Walks the edges in block order and stops at the first match, so the
+    result equals evaluate_rules(...)[0] without evaluating later edges.
+
+    Args:
+        wallet: Validated wallet address.
+        authority_edges: List of authority edge dicts from the graph.
+
+    Returns:
+        The earliest triggered rule dict (same format as evaluate_rules),
+        or None if no rule is triggered.
+    """
+    if not isinstance(authority_edges, list):
+        return None
+
+    # Stable sort, so ties keep list order as in evaluate_rules
+    ordered = sorted(
+        (edge for edge in authority_edges if isinstance(edge, dict)),
+        key=lambda e: e.get("block", 0),
+    )
+
+    for _, edge, rule in _iter_matches(ordered, authority_edges):
+        return _triggered_record(edge, rule)
+    return None
+
+
+# --- Private Helpers ---
+
+def _iter_matches(edges: list, all_edges: list, revoke_index: dict = None):
+    """
+    Yield (position, edge, rule) for each rule an edge triggers, in edge order.
+
+    Args:
+        edges: Edges to evaluate.
+        all_edges: Full edge list (role revokes are looked up here).
+        revoke_index: Prebuilt revoke index; built from all_edges on the
+                      first role_grant if omitted.
+    """
+    for position, edge in enumerate(edges):
         if not isinstance(edge, dict):
             continue
 
         edge_type = edge.get("type", "")
+        rules = _RULES_BY_TYPE.get(edge_type) if isinstance(edge_type, str) else None
+        if not rules:
+            continue
 
-        for rule in IRREVERSIBILITY_RULES:
-            if rule["edge_type"] != edge_type:
-                continue
+        detector = _DETECTORS.get(edge_type)
 
-            # Special handling for role_grant (needs full edge list)
+        for rule in rules:
+            # Special handling for role_grant (needs the revoke index,
+            # built once per call on the first grant)
             if edge_type == "role_grant":
-                matched = _detect_role_grant_without_revoke(edge, authority_edges)
+                if revoke_index is None:
+                    revoke_index = _build_revoke_index(all_edges)
+                matched = _detect_role_grant_without_revoke(edge, revoke_index)
             else:
-                detector = _DETECTORS.get(edge_type)
                 if detector is None:
                     continue
                 matched = detector(edge)
 
             if matched:
-                triggered.append({
-                    "rule_id": rule["id"],
-                    "rule_name": rule["name"],
-                    "severity": rule["severity"],
-                    "description": rule["description"],
-                    "triggering_edge": edge,
-                    "block": edge.get("block", 0),
-                })
+                yield position, edge, rule
 
-    # Deterministic ordering: earliest breach first
-    triggered.sort(key=lambda t: t["block"])
 
+def _triggered_record(edge: dict, rule: dict) -> dict:
+    """Build the triggered rule dict for an edge that matched a rule."""
+    record = _RULE_SNAPSHOTS[rule["id"]].copy()
+    record["triggering_edge"] = edge
+    record["block"] = edge.get("block", 0)
+    return record
+
+
+def _parallel_enabled() -> bool:
+    """Check whether process-parallel rule evaluation is requested."""
+    return os.environ.get(PARALLEL_RULES_ENV, "").strip().lower() not in ("", "0", "false", "no")
+
+
+def _evaluate_chunk(chunk: list, revoke_index: dict) -> list:
+    """Worker: return (position, rule_id) for each match in a chunk of edges."""
+    return [
+        (position, rule["id"])
+        for position, _, rule in _iter_matches(chunk, chunk, revoke_index)
+    ]
+
+
+def _evaluate_parallel(authority_edges: list, workers: int) -> list:
+    """
+    Evaluate rules over contiguous edge chunks in worker processes.
+
+    The revoke index is built once over the full list and sent to every
+    worker. Workers return only match positions, so the records are built
+    here and keep referencing the caller's edge objects; merging chunks
+    in order gives the same list as the serial path.
+    """
+    pool = _get_pool(workers)
+    revoke_index = _build_revoke_index(authority_edges)
+    size = -(-len(authority_edges) // workers)
+    starts = range(0, len(authority_edges), size)
+    futures = [
+        pool.submit(_evaluate_chunk, authority_edges[start:start + size], revoke_index)
+        for start in starts
+    ]
+
+    triggered = []
+    for start, future in zip(starts, futures):
+        for position, rule_id in future.result():
+            triggered.append(
+                _triggered_record(authority_edges[start + position], _RULES_BY_ID[rule_id])
+            )
     return triggered
+
+
+def _get_pool(workers: int):
+    """Return the shared worker pool, creating it on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # Imported here: the parallel path is opt-in, and these imports
+            # pull in multiprocessing, which most processes never need
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # "spawn", not the Linux default "fork": callers are often
+            # multithreaded (Streamlit), and a forked child inherits locks
+            # held by the parent's other threads
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            # Shut the workers down before interpreter teardown, which would
+            # otherwise run the pool's cleanup callbacks on half-torn-down modules
+            atexit.register(_POOL.shutdown)
+        return _POOL
@@ -1,15 +1,20 @@
 """
 PointZero Verdict Generator
 =============================
-Writes the irreversibility verdict to a JSON file.
+Writes the irreversibility verdict to a JSON (or MessagePack) file.
 Uses atomic writes for crash safety.
 """
 
-import json
 import os
-import tempfile
+import threading
 
 from backend.security import safe_file_path
+from backend.serialization import (
+    FORMAT_EXTENSIONS,
+    debug_json_enabled,
+    debug_json_path,
+    dumps,
+)
 
 
 # --- Schema Validation ---
@@ -58,9 +63,9 @@ def _validate_verdict(verdict_data: dict) -> None:
 
 # --- Public API ---
 
-def write_verdict(verdict_data: dict, output_path: str = None) -> str:
+def write_verdict(verdict_data: dict, output_path: str = None, format: str = "json") -> str:
     """
-    Write the verdict to a JSON file using atomic write.
+    Write the verdict to a JSON or MessagePack file using atomic write.
 
     The write is crash-safe: data is written to a temp file first,
     then atomically renamed to the target path.
@@ -68,13 +73,17 @@ def write_verdict(verdict_data: dict, output_path: str = None) -> str:
     Args:
         verdict_data: Validated verdict dict.
         output_path: Destination file path.
-                     Defaults to backend/data/irreversibility_verdict.json.
+                     Defaults to backend/data/irreversibility_verdict.json
+                     (.msgpack for the msgpack format).
+        format: "json" or "msgpack". With msgpack and POINTZERO_DEBUG_JSON
+                set, a JSON copy is written next to the file.
 
     Returns:
         Absolute path of the written file.
 
     Raises:
         ValueError: If verdict data is invalid or path is unsafe.
+        ImportError: If msgpack is requested but not installed.
     """
     # Validate verdict schema
     _validate_verdict(verdict_data)
@@ -82,7 +91,8 @@ def write_verdict(verdict_data: dict, output_path: str = None) -> str:
     # Resolve output path
     if output_path is None:
         output_path = os.path.join(
-            os.path.dirname(__file__), "data", "irreversibility_verdict.json"
+            os.path.dirname(__file__), "data",
+            "irreversibility_verdict" + FORMAT_EXTENSIONS.get(format, ".json")
         )
 
     resolved_path = safe_file_path(output_path)
@@ -90,18 +100,43 @@ def write_verdict(verdict_data: dict, output_path: str = None) -> str:
     # Ensure directory exists
     os.makedirs(os.path.dirname(resolved_path), exist_ok=True)
 
-    # Atomic write: write to temp file, then rename
-    dir_name = os.path.dirname(resolved_path)
-    tmp_path = None
+    _atomic_write(resolved_path, dumps(verdict_data, format))
+
+    if format == "msgpack" and debug_json_enabled():
+        _atomic_write(debug_json_path(resolved_path), dumps(verdict_data, "json"))
+
+    return resolved_path
+
+
+def _atomic_write(resolved_path: str, data: bytes) -> None:
+    """
+    Write bytes to a temp file next to the target, then rename it into place.
+
+    The temp name is unique per process and thread, so concurrent writers
+    never share a temp file; no random name or buffered file object needed.
+    Because the name is predictable, it is created exclusively (O_EXCL,
+    and O_NOFOLLOW where available): an existing file or a planted
+    symlink at that path is unlinked, never opened or written through.
+    """
+    tmp_path = f"{resolved_path}.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
-        fd, tmp_path = tempfile.mkstemp(
-            suffix=".tmp",
-            prefix="verdict_",
-            dir=dir_name,
+        flags = (
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL
+            | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_BINARY", 0)
         )
-        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
-            json.dump(verdict_data, tmp_file, indent=2, ensure_ascii=False)
-            tmp_file.write("\n")
+        try:
+            fd = os.open(tmp_path, flags, 0o644)
+        except FileExistsError:
+            # Stale temp file from a crashed write, or a symlink; unlink
+            # removes the link itself, not its target
+            os.unlink(tmp_path)
+            fd = os.open(tmp_path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
         # Atomic rename (same filesystem)
         os.replace(tmp_path, resolved_path)
@@ -112,5 +147,3 @@ def write_verdict(verdict_data: dict, output_path: str = None) -> str:
         if tmp_path and os.path.exists(tmp_path):
             os.remove(tmp_path)
         raise
-
-    return resolved_path
@@ -12,9 +12,21 @@ Schema:
 }
 """
 
-import json
 import os
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import itemgetter
+
+from backend.serialization import (
+    FORMAT_EXTENSIONS,
+    debug_json_enabled,
+    debug_json_path,
+    dumps,
+)
+
+
+# Address-valued event fields, lowercased during normalization
+_ADDR_FIELDS = frozenset({"contract", "spender", "new_admin", "new_owner", "grantee"})
+
 
 class GraphBuilder:
     """
@@ -35,61 +47,107 @@ class GraphBuilder:
         # Normalize wallet address
         wallet_norm = wallet_address.lower().strip()
 
-        # Build edges list
+        # Build edges list; address columns are resolved once per event
+        # schema (key tuple) and shared by every event with that schema,
+        # and each distinct address is lowercased once and shared by
+        # every edge that carries it
         edges = []
+        addr_keys_by_schema = {}
+        lowered = {}
         for event in events:
-            edge = self._process_event(event)
+            edge = self._process_event(event, addr_keys_by_schema, lowered)
             if edge:
                 edges.append(edge)
 
-        # Sort edges by block number
-        edges.sort(key=lambda e: e.get("block", 0))
+        # Sort edges by block number (_process_event always sets "block")
+        edges.sort(key=itemgetter("block"))
 
         return {
             "wallet": wallet_norm,
-            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             "authority_edges": edges
         }
 
-    def _process_event(self, event: dict) -> dict:
+    def _process_event(
+        self, event: dict, addr_keys_by_schema: dict = None, lowered: dict = None
+    ) -> dict:
         """
         Validate and sanitize a single authority event edge.
+
+        Args:
+            event: Raw event dict (not mutated).
+            addr_keys_by_schema: Optional cache mapping an event's key tuple
+                                 to its address-valued keys.
+            lowered: Optional cache mapping an address string to its
+                     lowercased form, so repeated addresses share one string.
         """
         # Ensure mandatory fields
         if not event.get("type") or not event.get("block"):
             return None
 
-        # Copy fields to avoid mutating source
-        edge = event.copy()
-
-        # Normalize address fields if present
-        for field in ["contract", "spender", "new_admin", "new_owner", "grantee"]:
-            if field in edge:
-                edge[field] = str(edge[field]).lower()
-
         # Ensure block is int
         try:
-            edge["block"] = int(edge["block"])
+            block = int(event["block"])
         except (ValueError, TypeError):
             return None
 
+        schema = tuple(event)
+        if addr_keys_by_schema is None:
+            addr_keys = [key for key in schema if key in _ADDR_FIELDS]
+        else:
+            addr_keys = addr_keys_by_schema.get(schema)
+            if addr_keys is None:
+                addr_keys = [key for key in schema if key in _ADDR_FIELDS]
+                addr_keys_by_schema[schema] = addr_keys
+
+        # Copy (source is not mutated), then normalize only the address
+        # fields of this schema
+        edge = event.copy()
+        if lowered is None:
+            for key in addr_keys:
+                edge[key] = str(edge[key]).lower()
+        else:
+            for key in addr_keys:
+                text = str(edge[key])
+                value = lowered.get(text)
+                if value is None:
+                    value = lowered[text] = text.lower()
+                edge[key] = value
+        edge["block"] = block
+
         return edge
 
 
-def save_graph_to_file(graph: dict, path: str = None) -> str:
+def save_graph_to_file(graph: dict, path: str = None, format: str = "json") -> str:
     """
-    Save the generated graph to a JSON file (useful for debugging/persistence).
+    Save the generated graph to a file (useful for debugging/persistence).
+
+    Args:
+        graph: Authority graph dict.
+        path: Destination path. Defaults to backend/data/authority_graph.json
+              (.msgpack for the msgpack format).
+        format: "json" or "msgpack". With msgpack and POINTZERO_DEBUG_JSON
+                set, a JSON copy is written next to the file.
+
+    Returns:
+        Path of the written file.
     """
     if path is None:
         path = os.path.join(
-            os.path.dirname(__file__), "data", "authority_graph.json"
+            os.path.dirname(__file__), "data",
+            "authority_graph" + FORMAT_EXTENSIONS.get(format, ".json")
         )
 
     # Use existing safe path logic if imports allowed, else manual check
     # Here we assume simple write since we control the path internally in analyze_wallet.py
     os.makedirs(os.path.dirname(path), exist_ok=True)
     
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(graph, f, indent=2)
+    data = dumps(graph, format)
+    with open(path, "wb") as f:
+        f.write(data)
+
+    if format == "msgpack" and debug_json_enabled():
+        with open(debug_json_path(path), "wb") as f:
+            f.write(dumps(graph, "json"))
     
     return path
@@ -1,7 +1,7 @@
 """
 PointZero Graph Loader Module
 ==============================
-Safe loader for the authority graph JSON file.
+Safe loader for the authority graph file (JSON, or MessagePack by extension).
 Validates the { "wallet": "...", "authority_edges": [...] } schema
 and prevents path traversal.
 """
@@ -11,6 +11,13 @@ import os
 from typing import Optional
 
 from backend.security import safe_file_path, validate_wallet_address
+from backend.serialization import format_for_path, loads
+
+
+# Graph file read when no path is given
+DEFAULT_GRAPH_PATH = os.path.join(
+    os.path.dirname(__file__), "data", "authority_graph.json"
+)
 
 
 # --- Schema Constants ---
@@ -28,13 +35,16 @@ VALID_EDGE_TYPES = frozenset({
 
 # --- Public API ---
 
-def load_authority_graph(path: str = None) -> dict:
+def load_authority_graph(path: str = None, trusted: bool = False) -> dict:
     """
-    Load and validate the authority graph from a JSON file.
+    Load and validate the authority graph from a JSON or MessagePack file.
 
     Args:
-        path: Path to the authority_graph.json file.
-              Defaults to backend/data/authority_graph.json.
+        path: Path to the authority graph file; a .msgpack extension
+              selects MessagePack. Defaults to backend/data/authority_graph.json.
+        trusted: The file was written by GraphBuilder in this deployment;
+                 only the top-level keys are checked, not every edge.
+                 Keep False for external or user-supplied files.
 
     Returns:
         Parsed and validated authority graph dict with:
@@ -44,11 +54,10 @@ def load_authority_graph(path: str = None) -> dict:
     Raises:
         FileNotFoundError: If the file does not exist.
         ValueError: If the JSON is malformed or schema is invalid.
+        ImportError: If the file is MessagePack and msgpack is not installed.
     """
     if path is None:
-        path = os.path.join(
-            os.path.dirname(__file__), "data", "authority_graph.json"
-        )
+        path = DEFAULT_GRAPH_PATH
 
     # Validate path safety
     resolved_path = safe_file_path(path)
@@ -58,25 +67,43 @@ def load_authority_graph(path: str = None) -> dict:
             f"Authority graph not found at: {resolved_path}"
         )
 
-    # Read and parse JSON
+    # Read and parse (bytes go to the parser without a decode step)
     try:
-        with open(resolved_path, "r", encoding="utf-8") as f:
+        if os.path.getsize(resolved_path) == 0:
+            raise ValueError("Authority graph file is empty.")
+        with open(resolved_path, "rb") as f:
             raw = f.read()
     except (IOError, OSError) as e:
         raise ValueError(f"Cannot read authority graph file: {e}") from e
 
-    if not raw.strip():
-        raise ValueError("Authority graph file is empty.")
-
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as e:
-        raise ValueError(
-            f"Authority graph contains invalid JSON: {e}"
-        ) from e
+    file_format = format_for_path(resolved_path)
+    if file_format == "msgpack":
+        try:
+            data = loads(raw, "msgpack")
+        except ValueError as e:
+            raise ValueError(
+                f"Authority graph contains invalid MessagePack: {e}"
+            ) from e
+    else:
+        try:
+            data = loads(raw, "json")
+            # orjson parses integers wider than 64 bits as floats; re-parse
+            # with json so values like raw uint256 amounts stay exact.
+            # GraphBuilder output only carries wide integers as amounts,
+            # so trusted loads check just that field
+            has_floats = _has_float_amounts if trusted else _has_float_edge_values
+            if has_floats(data):
+                data = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(
+                f"Authority graph contains invalid JSON: {e}"
+            ) from e
 
     # Validate schema
-    _validate_schema(data)
+    if trusted:
+        _validate_top_level(data)
+    else:
+        _validate_schema(data)
 
     return data
 
@@ -110,6 +137,31 @@ def get_graph_wallet(graph: dict) -> Optional[str]:
     return graph.get("wallet")
 
 
+def _has_float_edge_values(data) -> bool:
+    """Check whether any authority edge carries a float value."""
+    if not isinstance(data, dict):
+        return False
+    edges = data.get("authority_edges")
+    if not isinstance(edges, list):
+        return False
+    return any(
+        type(value) is float
+        for edge in edges if isinstance(edge, dict)
+        for value in edge.values()
+    )
+
+
+def _has_float_amounts(data) -> bool:
+    """Check whether any authority edge carries a float amount."""
+    edges = data.get("authority_edges") if isinstance(data, dict) else None
+    if not isinstance(edges, list):
+        return False
+    return any(
+        type(edge.get("amount")) is float
+        for edge in edges if type(edge) is dict
+    )
+
+
 # --- Schema Validation ---
 
 def _validate_schema(data: dict) -> None:
@@ -132,14 +184,7 @@ def _validate_schema(data: dict) -> None:
     Raises:
         ValueError: If schema is invalid.
     """
-    if not isinstance(data, dict):
-        raise ValueError("Authority graph must be a JSON object.")
-
-    missing_keys = REQUIRED_TOP_KEYS - set(data.keys())
-    if missing_keys:
-        raise ValueError(
-            f"Authority graph missing required keys: {missing_keys}"
-        )
+    _validate_top_level(data)
 
     # Validate wallet field
     wallet = data["wallet"]
@@ -151,27 +196,48 @@ def _validate_schema(data: dict) -> None:
     if not isinstance(edges, list):
         raise ValueError("'authority_edges' must be a JSON array.")
 
+    valid_types = VALID_EDGE_TYPES
+
     for i, edge in enumerate(edges):
         if not isinstance(edge, dict):
             raise ValueError(
                 f"authority_edges[{i}] must be a JSON object."
             )
 
-        missing = REQUIRED_EDGE_KEYS - set(edge.keys())
-        if missing:
+        # Explicit checks for REQUIRED_EDGE_KEYS; the set difference is
+        # only computed for the error message
+        if "type" not in edge or "block" not in edge:
+            missing = REQUIRED_EDGE_KEYS - edge.keys()
             raise ValueError(
                 f"authority_edges[{i}] missing required keys: {missing}"
             )
 
-        edge_type = edge.get("type", "")
-        if edge_type not in VALID_EDGE_TYPES:
+        edge_type = edge["type"]
+        if edge_type not in valid_types:
             raise ValueError(
                 f"authority_edges[{i}] has invalid type '{edge_type}'. "
                 f"Valid types: {sorted(VALID_EDGE_TYPES)}"
             )
 
-        block = edge.get("block")
+        block = edge["block"]
         if not isinstance(block, int) or block < 0:
             raise ValueError(
                 f"authority_edges[{i}] 'block' must be a non-negative integer."
             )
+
+
+def _validate_top_level(data: dict) -> None:
+    """
+    Check that the graph is an object with the required top-level keys.
+
+    Raises:
+        ValueError: If the graph is not a dict or is missing keys.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Authority graph must be a JSON object.")
+
+    missing_keys = REQUIRED_TOP_KEYS - set(data.keys())
+    if missing_keys:
+        raise ValueError(
+            f"Authority graph missing required keys: {missing_keys}"
+        )
@@ -16,9 +16,86 @@ is fully replaceable via the graph_path parameter or by passing a
 pre-loaded graph dict.
 """
 
-from backend.security import validate_wallet_address
-from backend.graph_loader import load_authority_graph, get_authority_edges, get_graph_wallet
-from backend.authority_rules import evaluate_rules
+import functools
+import os
+
+from backend.security import safe_file_path, validate_wallet_address
+from backend.graph_loader import (
+    DEFAULT_GRAPH_PATH,
+    get_authority_edges,
+    get_graph_wallet,
+    load_authority_graph,
+)
+from backend.authority_rules import (
+    earliest_triggered,
+    evaluate_rules_first,
+    find_triggered_rules,
+)
+
+
+# Verdict for wallets with no breach; copied and given the wallet per call
+# (copying measured faster than building the literal)
+_SAFE_VERDICT = {
+    "wallet": "",
+    "verdict": "TRUST SAFE",
+    "block": 0,
+    "reason": "No irreversible authority events detected",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_load(resolved_path: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Load a graph file once per (path, mtime, size).
+
+    A rewritten file gets a new key, so stale graphs are never served.
+    The returned dict is shared between calls and must not be mutated.
+    """
+    return _with_normalized_wallet(load_authority_graph(resolved_path))
+
+
+def _load_graph(path: str = None) -> tuple:
+    """
+    Load the authority graph, reusing the parsed graph while the file is unchanged.
+
+    Returns:
+        (graph, normalized graph wallet or None if the graph has none).
+    """
+    resolved_path = safe_file_path(path if path is not None else DEFAULT_GRAPH_PATH)
+    try:
+        stat = os.stat(resolved_path)
+    except OSError:
+        # Let the loader raise its usual error
+        return _with_normalized_wallet(load_authority_graph(resolved_path))
+    return _cached_load(resolved_path, stat.st_mtime_ns, stat.st_size)
+
+
+def _with_normalized_wallet(graph: dict) -> tuple:
+    """Pair a graph with its wallet, normalized once for comparisons."""
+    graph_wallet = get_graph_wallet(graph)
+    return graph, (graph_wallet.lower().strip() if graph_wallet else None)
+
+
+def _rank_breaches(triggered_rules: list, top_k: int = None) -> tuple:
+    """
+    Order triggered rules for a verdict.
+
+    Returns:
+        (earliest breach of all triggered rules or None, the rules to list:
+        all of them, or the top_k earliest).
+
+    Raises:
+        ValueError: If top_k is less than 1.
+    """
+    if top_k is None:
+        listed_rules = earliest_triggered(triggered_rules)
+        return (listed_rules[0] if listed_rules else None), listed_rules
+
+    # Select the first breach before trimming, so the verdict never
+    # depends on how many rules are listed
+    listed_rules = earliest_triggered(triggered_rules, top_k)
+    first = earliest_triggered(triggered_rules, 1)
+    return (first[0] if first else None), listed_rules
 
 
 class IrreversibilityEngine:
@@ -27,6 +104,9 @@ class IrreversibilityEngine:
     an irreversible trust boundary based on its authority edges.
     """
 
+    # One engine is created per analysis run; no per-instance __dict__
+    __slots__ = ("graph_path",)
+
     def __init__(self, graph_path: str = None):
         """
         Initialize the engine.
@@ -37,12 +117,18 @@ class IrreversibilityEngine:
         """
         self.graph_path = graph_path
 
-    def analyze(self, wallet_address: str) -> dict:
+    def analyze(self, wallet_address: str, detailed: bool = True, top_k: int = None) -> dict:
         """
         Run the full irreversibility analysis pipeline.
 
         Args:
             wallet_address: Raw wallet address string (will be validated).
+            detailed: Evaluate every rule and include 'details'. When False,
+                      evaluation stops at the earliest breach and the
+                      verdict has no 'details' key.
+            top_k: List at most this many (earliest, at least 1) triggered
+                   rules in 'details'; 'total_breaches' still counts all of
+                   them and the verdict still reflects the earliest breach.
 
         Returns:
             Verdict dict with keys:
@@ -50,43 +136,53 @@ class IrreversibilityEngine:
             - verdict: "TRUST BROKEN" | "TRUST SAFE"
             - block: int (block of first breach, or 0)
             - reason: str (human-readable cause)
-            - details: dict (extended analysis data)
+            - details: dict (extended analysis data, if detailed), with
+              'triggered_rules' as a list of dicts and the same data in
+              'triggered_rules_columns' as one list per field
 
         Raises:
-            ValueError: If wallet address is invalid or graph is malformed.
+            ValueError: If wallet address is invalid, graph is malformed,
+                        or top_k is less than 1.
             FileNotFoundError: If authority graph file is missing.
         """
         # Step 1: Validate wallet address
         validated_address = validate_wallet_address(wallet_address)
 
-        # Step 2: Load authority graph from file
-        graph = load_authority_graph(self.graph_path)
+        # Step 2: Load authority graph from file (cached while unchanged,
+        # together with its normalized wallet)
+        graph, graph_wallet_norm = _load_graph(self.graph_path)
 
         # Step 3: Verify graph wallet matches the requested wallet
-        graph_wallet = get_graph_wallet(graph)
-        wallet_mismatch = False
-        if graph_wallet:
-            graph_wallet_norm = graph_wallet.lower().strip()
-            if graph_wallet_norm != validated_address:
-                wallet_mismatch = True
+        wallet_mismatch = (
+            graph_wallet_norm is not None and graph_wallet_norm != validated_address
+        )
 
         # Step 4: Extract authority edges
         authority_edges = get_authority_edges(graph)
 
+        if not detailed:
+            first_breach = evaluate_rules_first(validated_address, authority_edges)
+            return self._build_summary(validated_address, first_breach)
+
         # Step 5: Evaluate all irreversibility rules against edges
-        triggered_rules = evaluate_rules(validated_address, authority_edges)
+        triggered_rules = find_triggered_rules(validated_address, authority_edges)
+        first_breach, listed_rules = _rank_breaches(triggered_rules, top_k)
 
         # Step 6: Build deterministic verdict
         verdict = self._build_verdict(
             wallet=validated_address,
-            triggered_rules=triggered_rules,
+            triggered_rules=listed_rules,
             authority_edges=authority_edges,
             wallet_mismatch=wallet_mismatch,
+            total_breaches=len(triggered_rules),
+            first_breach=first_breach,
         )
 
         return verdict
 
-    def analyze_graph(self, wallet_address: str, graph: dict) -> dict:
+    def analyze_graph(
+        self, wallet_address: str, graph: dict, detailed: bool = True, top_k: int = None
+    ) -> dict:
         """
         Analyze a pre-loaded authority graph (Liquify-ready interface).
 
@@ -96,66 +192,116 @@ class IrreversibilityEngine:
         Args:
             wallet_address: Raw wallet address string.
             graph: Pre-loaded and validated authority graph dict.
+            detailed: Include 'details' (see analyze()).
+            top_k: Limit on listed triggered rules (see analyze()).
 
         Returns:
             Verdict dict (same format as analyze()).
         """
         validated_address = validate_wallet_address(wallet_address)
+        return self._analyze_graph_fast(validated_address, graph, detailed, top_k)
+
+    def _analyze_graph_fast(
+        self, validated_address: str, graph: dict, detailed: bool = True, top_k: int = None
+    ) -> dict:
+        """
+        analyze_graph() for callers that already validated the address.
+
+        Args:
+            validated_address: Output of validate_wallet_address(); not re-checked.
+            graph: Pre-loaded and validated authority graph dict.
+            detailed: Include 'details' (see analyze()).
+            top_k: Limit on listed triggered rules (see analyze()).
+
+        Returns:
+            Verdict dict (same format as analyze()).
+        """
         authority_edges = get_authority_edges(graph)
-        triggered_rules = evaluate_rules(validated_address, authority_edges)
+
+        if not detailed:
+            first_breach = evaluate_rules_first(validated_address, authority_edges)
+            return self._build_summary(validated_address, first_breach)
+
+        triggered_rules = find_triggered_rules(validated_address, authority_edges)
+        first_breach, listed_rules = _rank_breaches(triggered_rules, top_k)
 
         return self._build_verdict(
             wallet=validated_address,
-            triggered_rules=triggered_rules,
+            triggered_rules=listed_rules,
             authority_edges=authority_edges,
             wallet_mismatch=False,
+            total_breaches=len(triggered_rules),
+            first_breach=first_breach,
         )
 
     # --- Private Helpers ---
 
     @staticmethod
-    def _build_verdict(
-        wallet: str,
-        triggered_rules: list,
-        authority_edges: list,
-        wallet_mismatch: bool,
-    ) -> dict:
-        """Build the final verdict dict from analysis results."""
+    def _build_summary(wallet: str, first_breach: dict = None) -> dict:
+        """Build the verdict without details from the earliest breach (or None)."""
 
-        if triggered_rules:
+        if first_breach:
             # TRUST BROKEN — use earliest (first) triggered rule
-            first_breach = triggered_rules[0]
             return {
                 "wallet": wallet,
                 "verdict": "TRUST BROKEN",
                 "block": first_breach["block"],
                 "reason": first_breach["rule_name"],
-                "details": {
-                    "total_breaches": len(triggered_rules),
-                    "edges_analyzed": len(authority_edges),
-                    "wallet_mismatch": wallet_mismatch,
-                    "triggered_rules": [
-                        {
-                            "rule_id": r["rule_id"],
-                            "rule_name": r["rule_name"],
-                            "severity": r["severity"],
-                            "block": r["block"],
-                            "description": r["description"],
-                        }
-                        for r in triggered_rules
-                    ],
-                },
             }
         else:
-            return {
-                "wallet": wallet,
-                "verdict": "TRUST SAFE",
-                "block": 0,
-                "reason": "No irreversible authority events detected",
-                "details": {
-                    "total_breaches": 0,
-                    "edges_analyzed": len(authority_edges),
-                    "wallet_mismatch": wallet_mismatch,
-                    "triggered_rules": [],
-                },
-            }
+            verdict = _SAFE_VERDICT.copy()
+            verdict["wallet"] = wallet
+            return verdict
+
+    @classmethod
+    def _build_verdict(
+        cls,
+        wallet: str,
+        triggered_rules: list,
+        authority_edges: list,
+        wallet_mismatch: bool,
+        total_breaches: int = None,
+        first_breach: dict = None,
+    ) -> dict:
+        """
+        Build the final verdict dict from analysis results.
+
+        The verdict, block and reason come from first_breach, the earliest
+        of all triggered rules; triggered_rules may be a top_k selection
+        and only fills 'details'. Without first_breach, triggered_rules
+        must be the full ordered list.
+        """
+
+        if first_breach is None and triggered_rules:
+            first_breach = triggered_rules[0]
+        verdict = cls._build_summary(wallet, first_breach)
+        verdict["details"] = {
+            "total_breaches": (
+                len(triggered_rules) if total_breaches is None else total_breaches
+            ),
+            "edges_analyzed": len(authority_edges),
+            "wallet_mismatch": wallet_mismatch,
+            # New dicts, not the triggered records themselves: those also
+            # carry triggering_edge, which stays out of the verdict. A
+            # literal measured faster than a key-tuple comprehension.
+            "triggered_rules": [
+                {
+                    "rule_id": r["rule_id"],
+                    "rule_name": r["rule_name"],
+                    "severity": r["severity"],
+                    "block": r["block"],
+                    "description": r["description"],
+                }
+                for r in triggered_rules
+            ],
+            # The same rules as parallel columns, for consumers that scan
+            # or filter one field (e.g. severity) across all breaches
+            "triggered_rules_columns": {
+                "rule_id": [r["rule_id"] for r in triggered_rules],
+                "rule_name": [r["rule_name"] for r in triggered_rules],
+                "severity": [r["severity"] for r in triggered_rules],
+                "block": [r["block"] for r in triggered_rules],
+                "description": [r["description"] for r in triggered_rules],
+            },
+        }
+        return verdict
@@ -10,10 +10,16 @@ Mock Logic:
 - Uses address hash to randomize event details (blocks, amounts, contracts)
 """
 
+import functools
 import hashlib
 import time
 
 
+# Bytes per mock address, and the number of address slots drawn per wallet
+ADDRESS_BYTES = 20
+RANDOM_ADDRESS_SLOTS = 9
+
+
 class LiquifyClient:
     """
     Client for fetching raw authority events for a wallet.
@@ -45,84 +51,165 @@ class LiquifyClient:
         """
         Generate deterministic mock events based on wallet address hash.
         """
-        # Seed logic: last hex char determines risk profile
-        # 0-3: Critical breach (Unlimited Approval)
-        # 4-5: Critical breach (Proxy Admin Transfer)
-        # 6-7: Critical breach (Ownership Transfer)
-        # 8-b: High risk (Role Grant)
-        # c-f: Safe (No breaches, only transfers/revokes)
-        
-        last_char = wallet_address[-1].lower()
-        seed = int(last_char, 16)
-        
-        # Consistent randomness based on full address
-        addr_hash = int(hashlib.sha256(wallet_address.encode()).hexdigest(), 16)
-        base_block = 18_000_000 + (addr_hash % 1_000_000)
-        
-        events = []
-
-        if seed <= 3:  # Unlimited Approval
-            events.append({
-                "type": "token_approval",
-                "contract": f"0x{self._random_hex(40, addr_hash + 1)}",
-                "spender": f"0x{self._random_hex(40, addr_hash + 2)}",
-                "amount": str(2**256 - 1),  # MAX_UINT256
-                "block": base_block + 120,
-                "timestamp": int(time.time()) - 86400
-            })
-
-        elif seed <= 5:  # Proxy Admin Transfer
-            events.append({
-                "type": "proxy_admin_transfer",
-                "contract": f"0x{self._random_hex(40, addr_hash + 3)}",
-                "new_admin": "0xdead000000000000000000000000000000000000",
-                "previous_admin": wallet_address,
-                "block": base_block + 450,
-                "timestamp": int(time.time()) - 43200
-            })
-
-        elif seed <= 7:  # Ownership Transfer
-            events.append({
-                "type": "ownership_transfer",
-                "contract": f"0x{self._random_hex(40, addr_hash + 4)}",
-                "new_owner": "0xdead000000000000000000000000000000000000",
-                "previous_owner": wallet_address,
-                "block": base_block + 60,
-                "timestamp": int(time.time()) - 172800
-            })
-
-        elif seed <= 0xb:  # Role Grant (High Risk)
-            events.append({
-                "type": "role_grant",
-                "contract": f"0x{self._random_hex(40, addr_hash + 5)}",
-                "role": "MINTER_ROLE",
-                "grantee": "0xdead000000000000000000000000000000000000",
-                "block": base_block + 200,
-                "timestamp": int(time.time()) - 100000
-            })
-
-        else:  # Safe Scenarios (c-f)
-            # Add a safe approval (limited amount)
-            events.append({
-                "type": "token_approval",
-                "contract": f"0x{self._random_hex(40, addr_hash + 6)}",
-                "spender": f"0x{self._random_hex(40, addr_hash + 7)}",
-                "amount": "500000000000000000000",  # 500 tokens
-                "block": base_block - 1000,
-                "timestamp": int(time.time()) - 500000
-            })
-            # Add a role revoke (safe)
-            events.append({
-                "type": "role_revoke",
-                "contract": f"0x{self._random_hex(40, addr_hash + 8)}",
-                "role": "ADMIN_ROLE",
-                "grantee": f"0x{self._random_hex(40, addr_hash + 9)}",
-                "block": base_block - 500,
-                "timestamp": int(time.time()) - 250000
-            })
-
-        return events
-
-    def _random_hex(self, length: int, seed: int) -> str:
-        """Helper to generate deterministic hex strings."""
-        return hashlib.shake_256(str(seed).encode()).hexdigest(length // 2)
+        # One clock read per call, shared by every event (the cached
+        # templates carry ages, so timestamps stay current)
+        now = int(time.time())
+        return [
+            {**fields, "timestamp": now - age}
+            for fields, age in _mock_event_templates(wallet_address)
+        ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _mock_event_templates(wallet_address: str) -> tuple:
+    """
+    Build the time-independent part of a wallet's mock events.
+
+    Returns a tuple of (event fields, age in seconds) pairs; the caller
+    adds "timestamp" (now - age). Cached per address, so repeat queries
+    skip the hashing. The field dicts are shared and must not be mutated.
+    """
+    # Seed logic: last hex char determines risk profile
+    # 0-3: Critical breach (Unlimited Approval)
+    # 4-5: Critical breach (Proxy Admin Transfer)
+    # 6-7: Critical breach (Ownership Transfer)
+    # 8-b: High risk (Role Grant)
+    # c-f: Safe (No breaches, only transfers/revokes)
+
+    last_char = wallet_address[-1].lower()
+    seed = int(last_char, 16)
+
+    # Consistent randomness based on full address
+    addr_hash = int.from_bytes(hashlib.sha256(wallet_address.encode()).digest(), "big")
+    base_block = 18_000_000 + (addr_hash % 1_000_000)
+
+    # One SHAKE-256 squeeze supplies every random address (slots 1-9)
+    random_bytes = hashlib.shake_256(wallet_address.encode()).digest(
+        ADDRESS_BYTES * RANDOM_ADDRESS_SLOTS
+    )
+
+    return _SCENARIO_BUILDERS[_SCENARIO_BY_SEED[seed]](
+        wallet_address, random_bytes, base_block
+    )
+
+
+# --- Mock Scenarios ---
+# Each builder returns a tuple of (event fields, age in seconds) pairs.
+# Events are copies of the templates below with the per-wallet fields
+# (None here) filled in; copying measured faster than building the literal.
+
+# Stand-in recipient for authority handed away irrecoverably
+_BURN_ADDRESS = "0xdead000000000000000000000000000000000000"
+_MAX_UINT256 = str(2**256 - 1)
+
+_UNLIMITED_APPROVAL_TEMPLATE = {
+    "type": "token_approval",
+    "contract": None,
+    "spender": None,
+    "amount": _MAX_UINT256,
+    "block": None,
+}
+_PROXY_ADMIN_TRANSFER_TEMPLATE = {
+    "type": "proxy_admin_transfer",
+    "contract": None,
+    "new_admin": _BURN_ADDRESS,
+    "previous_admin": None,
+    "block": None,
+}
+_OWNERSHIP_TRANSFER_TEMPLATE = {
+    "type": "ownership_transfer",
+    "contract": None,
+    "new_owner": _BURN_ADDRESS,
+    "previous_owner": None,
+    "block": None,
+}
+_ROLE_GRANT_TEMPLATE = {
+    "type": "role_grant",
+    "contract": None,
+    "role": "MINTER_ROLE",
+    "grantee": _BURN_ADDRESS,
+    "block": None,
+}
+_LIMITED_APPROVAL_TEMPLATE = {
+    "type": "token_approval",
+    "contract": None,
+    "spender": None,
+    "amount": "500000000000000000000",  # 500 tokens
+    "block": None,
+}
+_ROLE_REVOKE_TEMPLATE = {
+    "type": "role_revoke",
+    "contract": None,
+    "role": "ADMIN_ROLE",
+    "grantee": None,
+    "block": None,
+}
+
+
+def _build_unlimited_approval(wallet_address: str, random_bytes: bytes, base_block: int) -> tuple:
+    """Critical breach: unlimited token approval."""
+    event = _UNLIMITED_APPROVAL_TEMPLATE.copy()
+    event["contract"] = _random_address(random_bytes, 1)
+    event["spender"] = _random_address(random_bytes, 2)
+    event["block"] = base_block + 120
+    return ((event, 86400),)
+
+
+def _build_proxy_admin_transfer(wallet_address: str, random_bytes: bytes, base_block: int) -> tuple:
+    """Critical breach: proxy admin handed to a burn address."""
+    event = _PROXY_ADMIN_TRANSFER_TEMPLATE.copy()
+    event["contract"] = _random_address(random_bytes, 3)
+    event["previous_admin"] = wallet_address
+    event["block"] = base_block + 450
+    return ((event, 43200),)
+
+
+def _build_ownership_transfer(wallet_address: str, random_bytes: bytes, base_block: int) -> tuple:
+    """Critical breach: ownership handed to a burn address."""
+    event = _OWNERSHIP_TRANSFER_TEMPLATE.copy()
+    event["contract"] = _random_address(random_bytes, 4)
+    event["previous_owner"] = wallet_address
+    event["block"] = base_block + 60
+    return ((event, 172800),)
+
+
+def _build_role_grant(wallet_address: str, random_bytes: bytes, base_block: int) -> tuple:
+    """High risk: minter role granted to a burn address."""
+    event = _ROLE_GRANT_TEMPLATE.copy()
+    event["contract"] = _random_address(random_bytes, 5)
+    event["block"] = base_block + 200
+    return ((event, 100000),)
+
+
+def _build_safe(wallet_address: str, random_bytes: bytes, base_block: int) -> tuple:
+    """Safe: a limited approval and a role revoke."""
+    # Add a safe approval (limited amount)
+    approval = _LIMITED_APPROVAL_TEMPLATE.copy()
+    approval["contract"] = _random_address(random_bytes, 6)
+    approval["spender"] = _random_address(random_bytes, 7)
+    approval["block"] = base_block - 1000
+
+    # Add a role revoke (safe)
+    revoke = _ROLE_REVOKE_TEMPLATE.copy()
+    revoke["contract"] = _random_address(random_bytes, 8)
+    revoke["grantee"] = _random_address(random_bytes, 9)
+    revoke["block"] = base_block - 500
+
+    return ((approval, 500000), (revoke, 250000))
+
+
+# Scenario index for each seed (last hex digit), and the builder per index
+_SCENARIO_BY_SEED = (0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4)
+_SCENARIO_BUILDERS = (
+    _build_unlimited_approval,
+    _build_proxy_admin_transfer,
+    _build_ownership_transfer,
+    _build_role_grant,
+    _build_safe,
+)
+
+
+def _random_address(random_bytes: bytes, slot: int) -> str:
+    """Deterministic mock address from a 1-based slot of the SHAKE output."""
+    start = (slot - 1) * ADDRESS_BYTES
+    return "0x" + random_bytes[start:start + ADDRESS_BYTES].hex()
@@ -5,16 +5,36 @@ Input validation, sanitization, and file-safety utilities.
 All external inputs must pass through this module before processing.
 """
 
+import functools
 import re
 import os
 
 # --- Constants ---
 
-WALLET_PATTERN = re.compile(r"^0x[0-9a-fA-F]{40}$")
+# Used with fullmatch, so no anchors (and no "$" newline loophole)
+WALLET_PATTERN = re.compile(r"0x[0-9a-fA-F]{40}")
 MAX_INPUT_LENGTH = 256
 ALLOWED_DATA_DIR = os.path.normpath(
     os.path.join(os.path.dirname(__file__), "data")
 )
+# With the trailing separator, so ".../data_evil" does not pass as ".../data"
+_ALLOWED_DATA_PREFIX = os.path.join(ALLOWED_DATA_DIR, "")
+
+# Null bytes and control characters (except newline/tab/carriage return)
+CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+)
+
+# str.translate has an ASCII fast path that beats the regex from about
+# this length on; for short or non-ASCII strings the regex is faster
+_TRANSLATE_MIN_LENGTH = 32
+
+# Length of a "0x" + 40 hex character address
+WALLET_LENGTH = 42
+
+# Batches at least this large are checked as one NumPy byte array
+BATCH_VECTORIZE_THRESHOLD = 100
 
 
 # --- Wallet Validation ---
@@ -45,7 +65,7 @@ def validate_wallet_address(address: str) -> str:
             f"Input exceeds maximum length of {MAX_INPUT_LENGTH} characters."
         )
 
-    if not WALLET_PATTERN.match(address):
+    if not WALLET_PATTERN.fullmatch(address):
         raise ValueError(
             f"Invalid Ethereum address format: '{address}'. "
             "Expected '0x' followed by 40 hexadecimal characters."
@@ -55,6 +75,78 @@ def validate_wallet_address(address: str) -> str:
     return address.lower()
 
 
+def validate_wallet_addresses(addresses: list) -> list:
+    """
+    Validate a batch of Ethereum wallet addresses.
+
+    Same result as calling validate_wallet_address() on each address in
+    order. When NumPy is installed and every address in a large batch is
+    already a bare 42-character string, all of them are checked at once
+    as an (N, 42) byte array; otherwise each is validated individually.
+
+    Args:
+        addresses: Raw address strings.
+
+    Returns:
+        List of lowercase-normalized addresses, in input order.
+
+    Raises:
+        ValueError: For the first malformed address.
+    """
+    addresses = list(addresses)
+
+    if len(addresses) >= BATCH_VECTORIZE_THRESHOLD and _all_bare_addresses(addresses):
+        return [address.lower() for address in addresses]
+
+    return [validate_wallet_address(address) for address in addresses]
+
+
+def _all_bare_addresses(addresses: list) -> bool:
+    """
+    Check that every entry is exactly "0x" + 40 hex characters (no padding).
+
+    Returns False, so the caller validates one by one, when NumPy is not
+    installed or any entry needs closer inspection.
+    """
+    numpy_support = _load_numpy_hex_table()
+    if numpy_support is None:
+        return False
+    np, hex_table = numpy_support
+
+    try:
+        joined = "".join(addresses)
+    except TypeError:
+        return False  # Non-string entry
+
+    # Every entry must be 42 long, or rows would straddle two entries
+    if not joined.isascii() or set(map(len, addresses)) != {WALLET_LENGTH}:
+        return False
+
+    rows = np.frombuffer(joined.encode("ascii"), dtype=np.uint8).reshape(-1, WALLET_LENGTH)
+    return bool(
+        (rows[:, 0] == ord("0")).all()
+        and (rows[:, 1] == ord("x")).all()
+        and np.take(hex_table, rows[:, 2:]).all()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_numpy_hex_table():
+    """
+    Return (numpy, boolean lookup of hex digit bytes), or None without NumPy.
+
+    NumPy is imported on first use so that loading this module stays cheap.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    table = np.zeros(256, dtype=bool)
+    table[list(b"0123456789abcdefABCDEF")] = True
+    return np, table
+
+
 # --- General Input Sanitization ---
 
 def sanitize_input(value: str) -> str:
@@ -85,7 +177,11 @@ def sanitize_input(value: str) -> str:
         )
 
     # Reject null bytes and control characters (except newline/tab)
-    if re.search(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", value):
+    if len(value) >= _TRANSLATE_MIN_LENGTH and value.isascii():
+        forbidden = len(value.translate(_CONTROL_CHARS_TABLE)) != len(value)
+    else:
+        forbidden = CONTROL_CHARS_PATTERN.search(value) is not None
+    if forbidden:
         raise ValueError("Input contains forbidden control characters.")
 
     return value
@@ -110,9 +206,18 @@ def safe_file_path(path: str) -> str:
     if not isinstance(path, str):
         raise ValueError("File path must be a string.")
 
-    resolved = os.path.normpath(os.path.abspath(path))
+    # Relative paths resolve against the working directory, so it is
+    # part of the cache key
+    cwd = None if os.path.isabs(path) else os.getcwd()
+    return _resolve_data_path(path, cwd)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_data_path(path: str, cwd: str = None) -> str:
+    """Resolve and check a path for safe_file_path (cached per path and cwd)."""
+    resolved = os.path.normpath(os.path.join(cwd, path) if cwd else path)
 
-    if not resolved.startswith(ALLOWED_DATA_DIR):
+    if resolved != ALLOWED_DATA_DIR and not resolved.startswith(_ALLOWED_DATA_PREFIX):
         raise ValueError(
             f"Access denied: path '{path}' resolves outside the allowed "
             f"data directory '{ALLOWED_DATA_DIR}'."
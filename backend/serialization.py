@@ -0,0 +1,141 @@
+"""
+PointZero Serialization Module
+==============================
+Encoding and decoding for the persisted graph and verdict files.
+
+Formats:
+- "json":    Indented JSON via orjson (default, human-readable)
+- "msgpack": MessagePack, smaller and faster to parse (needs `msgpack`)
+
+Set POINTZERO_DEBUG_JSON=1 to also write a JSON copy next to every
+MessagePack file.
+"""
+
+import json
+import os
+
+import orjson
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# --- Constants ---
+
+FORMAT_EXTENSIONS = {
+    "json": ".json",
+    "msgpack": ".msgpack",
+}
+
+DEBUG_JSON_ENV = "POINTZERO_DEBUG_JSON"
+
+
+# --- Public API ---
+
+def format_for_path(path: str) -> str:
+    """
+    Infer the serialization format from a file extension.
+
+    Args:
+        path: File path.
+
+    Returns:
+        "msgpack" for .msgpack files, otherwise "json".
+    """
+    if path.lower().endswith(FORMAT_EXTENSIONS["msgpack"]):
+        return "msgpack"
+    return "json"
+
+
+def dumps(data, format: str = "json") -> bytes:
+    """
+    Serialize data to bytes.
+
+    Args:
+        data: JSON-compatible object.
+        format: "json" or "msgpack".
+
+    Returns:
+        Encoded bytes.
+
+    Raises:
+        ValueError: If the format is unknown or the data cannot be encoded.
+        ImportError: If msgpack is requested but not installed.
+    """
+    if format == "json":
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            )
+        except orjson.JSONEncodeError:
+            # orjson rejects integers wider than 64 bits (e.g. raw uint256 amounts)
+            return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+    if format == "msgpack":
+        try:
+            return _require_msgpack().packb(data, use_bin_type=True)
+        except OverflowError as e:
+            raise ValueError(
+                f"Cannot encode as MessagePack ({e}); integers wider than "
+                "64 bits need the JSON format."
+            ) from e
+
+    raise ValueError(
+        f"Unknown serialization format: '{format}'. "
+        f"Must be one of: {sorted(FORMAT_EXTENSIONS)}"
+    )
+
+
+def loads(raw: bytes, format: str = "json"):
+    """
+    Deserialize bytes produced by dumps().
+
+    Args:
+        raw: Encoded bytes.
+        format: "json" or "msgpack".
+
+    Returns:
+        Decoded object.
+
+    Raises:
+        ValueError: If the format is unknown or the data is malformed.
+        ImportError: If msgpack is requested but not installed.
+    """
+    if format == "json":
+        return orjson.loads(raw)
+
+    if format == "msgpack":
+        unpackb = _require_msgpack().unpackb
+        try:
+            return unpackb(raw, raw=False)
+        except Exception as e:
+            raise ValueError(str(e) or type(e).__name__) from e
+
+    raise ValueError(
+        f"Unknown serialization format: '{format}'. "
+        f"Must be one of: {sorted(FORMAT_EXTENSIONS)}"
+    )
+
+
+def debug_json_enabled() -> bool:
+    """Check whether JSON debug copies of MessagePack files are requested."""
+    return os.environ.get(DEBUG_JSON_ENV, "").strip().lower() not in ("", "0", "false", "no")
+
+
+def debug_json_path(path: str) -> str:
+    """Path of the JSON debug copy for a MessagePack file."""
+    return os.path.splitext(path)[0] + FORMAT_EXTENSIONS["json"]
+
+
+# --- Private Helpers ---
+
+def _require_msgpack():
+    """Return the msgpack module, or raise if it is not installed."""
+    if msgpack is None:
+        raise ImportError(
+            "The msgpack format requires the 'msgpack' package. "
+            "Install with: pip install msgpack"
+        )
+    return msgpack
@@ -0,0 +1,88 @@
+"""
+Test Suite for the Irreversibility Engine
+
+Validates that listing fewer triggered rules (top_k) never changes the verdict
+"""
+
+import sys
+import os
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.irreversibility_engine import IrreversibilityEngine
+
+
+WALLET = "0x" + "a" * 40
+
+GRAPH = {
+    "wallet": WALLET,
+    "authority_edges": [
+        {
+            "type": "token_approval",
+            "contract": "0x" + "1" * 40,
+            "spender": "0x" + "2" * 40,
+            "amount": str(2**256 - 1),
+            "block": 300
+        },
+        {
+            "type": "ownership_transfer",
+            "contract": "0x" + "3" * 40,
+            "new_owner": "0xdead000000000000000000000000000000000000",
+            "previous_owner": WALLET,
+            "block": 100
+        },
+        {
+            "type": "role_grant",
+            "contract": "0x" + "4" * 40,
+            "role": "MINTER_ROLE",
+            "grantee": "0xdead000000000000000000000000000000000000",
+            "block": 200
+        }
+    ]
+}
+
+
+def test_top_k_one_keeps_verdict():
+    """Test top_k=1 lists one rule but keeps the full verdict"""
+    engine = IrreversibilityEngine()
+    full = engine.analyze_graph(WALLET, GRAPH)
+    top = engine.analyze_graph(WALLET, GRAPH, top_k=1)
+    
+    assert full["details"]["total_breaches"] > 1, "Graph has several breaches"
+    for key in ("wallet", "verdict", "block", "reason"):
+        assert top[key] == full[key], f"top_k=1 keeps '{key}'"
+    assert top["verdict"] == "TRUST BROKEN"
+    assert top["details"]["total_breaches"] == full["details"]["total_breaches"], \
+        "total_breaches counts every breach"
+    assert top["details"]["triggered_rules"] == full["details"]["triggered_rules"][:1], \
+        "Earliest rule listed"
+    print("✓ top_k=1 keeps the verdict")
+
+
+def test_top_k_zero_rejected():
+    """Test top_k below 1 is rejected instead of reporting TRUST SAFE"""
+    engine = IrreversibilityEngine()
+    for top_k in (0, -1):
+        try:
+            engine.analyze_graph(WALLET, GRAPH, top_k=top_k)
+            assert False, f"Should reject top_k={top_k}"
+        except ValueError as e:
+            assert "top_k" in str(e)
+    print("✓ top_k below 1 rejected")
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running Irreversibility Engine Tests\n")
+    
+    try:
+        test_top_k_one_keeps_verdict()
+        test_top_k_zero_rejected()
+        
+        print("\n✅ All tests passed!\n")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}\n")
+        exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}\n")
+        exit(1)
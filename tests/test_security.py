@@ -0,0 +1,142 @@
+"""
+Test Suite for the Security Module
+
+Validates path containment for the data directory and batch wallet
+validation
+"""
+
+import sys
+import os
+import random
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.security import (
+    ALLOWED_DATA_DIR,
+    BATCH_VECTORIZE_THRESHOLD,
+    safe_file_path,
+    validate_wallet_address,
+    validate_wallet_addresses,
+)
+
+
+BACKEND_DIR = os.path.dirname(ALLOWED_DATA_DIR)
+
+
+def test_safe_file_path_accepts_data_dir():
+    """Test paths inside backend/data are accepted"""
+    path = os.path.join(BACKEND_DIR, "data", "x.json")
+    assert safe_file_path(path) == os.path.join(ALLOWED_DATA_DIR, "x.json")
+    assert safe_file_path(ALLOWED_DATA_DIR) == ALLOWED_DATA_DIR, "The directory itself"
+    print("✓ Paths inside backend/data accepted")
+
+
+def test_safe_file_path_rejects_sibling_prefixes():
+    """Test siblings sharing the 'data' prefix are rejected"""
+    for path in [
+        os.path.join(BACKEND_DIR, "data_evil", "x.json"),
+        os.path.join(BACKEND_DIR, "datax"),
+        os.path.join(ALLOWED_DATA_DIR, "..", "data_evil", "x.json"),
+    ]:
+        try:
+            safe_file_path(path)
+            assert False, f"Should reject {path}"
+        except ValueError as e:
+            assert "Access denied" in str(e)
+    print("✓ Sibling prefixes rejected")
+
+
+def test_safe_file_path_relative():
+    """Test relative paths resolve against the working directory"""
+    cwd = os.getcwd()
+    try:
+        os.chdir(BACKEND_DIR)
+        assert safe_file_path(os.path.join("data", "x.json")) == \
+            os.path.join(ALLOWED_DATA_DIR, "x.json")
+        for path in [os.path.join("data_evil", "x.json"), "datax"]:
+            try:
+                safe_file_path(path)
+                assert False, f"Should reject {path}"
+            except ValueError:
+                pass
+    finally:
+        os.chdir(cwd)
+    print("✓ Relative paths checked")
+
+
+
+def _random_address(rng):
+    """A valid address with mixed-case hex digits"""
+    return "0x" + "".join(rng.choice("0123456789abcdefABCDEF") for _ in range(40))
+
+
+def _outcome(validate, addresses):
+    """Result of a validator, or the type and message of what it raised"""
+    try:
+        return validate(addresses)
+    except Exception as e:
+        return (type(e), str(e))
+
+
+def _per_address(addresses):
+    """Reference result: validate_wallet_address on each address in order"""
+    return [validate_wallet_address(address) for address in addresses]
+
+
+def test_batch_matches_per_address_validation():
+    """Test large batches give the same result as validating one by one"""
+    rng = random.Random(7)
+    size = BATCH_VECTORIZE_THRESHOLD + 50
+    valid = [_random_address(rng) for _ in range(size)]
+    
+    assert validate_wallet_addresses(valid) == _per_address(valid), "All valid"
+    assert validate_wallet_addresses(valid[:5]) == _per_address(valid[:5]), "Small batch"
+    
+    # 41 + 43 characters add up to two 42-character rows
+    short, long = valid[0][:-1], valid[1] + "a"
+    bad_entries = [
+        short,
+        long,
+        "0x" + "é" * 40,
+        valid[2][:-1] + "٣",
+        "0x" + "g" * 40,
+        " " + valid[3] + " ",
+        None,
+        42,
+        "",
+    ]
+    for bad in bad_entries:
+        for position in (0, size // 2, size - 1):
+            batch = list(valid)
+            batch[position] = bad
+            assert _outcome(validate_wallet_addresses, batch) == \
+                _outcome(_per_address, batch), \
+                f"Batch with {bad!r} at {position} matches per-address validation"
+    
+    # Several invalid entries: the message names the first one
+    batch = list(valid)
+    batch[10], batch[20] = short, long
+    batch[30], batch[40] = long, short
+    expected = _outcome(_per_address, batch)
+    assert expected[0] is ValueError and short in expected[1]
+    assert _outcome(validate_wallet_addresses, batch) == expected, "First invalid reported"
+    print("✓ Batch validation matches per-address validation")
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running Security Tests\n")
+    
+    try:
+        test_safe_file_path_accepts_data_dir()
+        test_safe_file_path_rejects_sibling_prefixes()
+        test_safe_file_path_relative()
+        test_batch_matches_per_address_validation()
+        
+        print("\n✅ All tests passed!\n")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}\n")
+        exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}\n")
+        exit(1)